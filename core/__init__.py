@@ -2,9 +2,9 @@
 Core package - Business logic
 """
 
-from .telemetry_recorder import TelemetryRecorder
+from .telemetry_recorder import TelemetryRecorder, TelemetryRecord
 from .screen_recorder import ScreenRecorder
 from .session_monitor import ACCSessionMonitor, SessionStatus
 from .acc_telemetry import ACCTelemetry
 
-__all__ = ['TelemetryRecorder', 'ScreenRecorder', 'ACCSessionMonitor', 'SessionStatus', 'ACCTelemetry']
+__all__ = ['TelemetryRecorder', 'TelemetryRecord', 'ScreenRecorder', 'ACCSessionMonitor', 'SessionStatus', 'ACCTelemetry']
@@ -9,6 +9,47 @@ import struct
 from ctypes import *
 from typing import Dict, List, Optional
 
+
+# Estructuras precompiladas (C++ con pack(4)); 'Nx' salta campos que no se usan
+
+# SPageFilePhysics desde packetId hasta clutch (PHYSICS_RECORD_SIZE bytes)
+_PHYSICS_RECORD = struct.Struct(
+    '<i3f2i2f'      # packetId, gas, brake, fuel, gear, rpms, steerAngle, speedKmh
+    '3f3f'          # velocity[3], accG[3]
+    '4f4f4f4f4f'    # wheelSlip, wheelLoad, wheelsPressure, wheelAngularSpeed, tyreWear
+    '16x4f16x4f'    # tyreDirtyLevel, tyreCoreTemperature, camberRAD, suspensionTravel
+    '4x4f4x'        # drs, tc, heading, pitch, roll, cgHeight
+    '20x4x4xf'      # carDamage[5], tyresOut, pitLimiter, abs
+    '8x4x8x'        # kersCharge, kersInput, autoShifter, rideHeight[2]
+    'f4x3f'         # turboBoost, ballast, airDensity, airTemp, roadTemp
+    '12x4x4x28x'    # localAngularVel[3], finalFF, perfMeter, engineBrake/ers
+    '4ff'           # brakeTemp[4], clutch
+)
+
+# SPageFileGraphic desde packetId hasta normalizedCarPosition
+_GRAPHICS_SESSION = struct.Struct(
+    '<3i'           # packetId, status, session
+    '30s30s30s30s'  # currentTime, lastTime, bestTime, split (wchar_t[15])
+    '5i2f4i'        # completedLaps .. iBestTime, sessionTimeLeft, distanceTraveled, isInPit .. numberOfLaps
+    '66s4xf'        # tyreCompound (wchar_t[33]), replayTimeMultiplier, normalizedCarPosition
+)
+
+# SPageFileGraphic.status
+_GRAPHICS_STATUS = struct.Struct('<i')
+
+# SPageFileStatic desde smVersion hasta maxFuel
+_STATIC_CAR_INFO = struct.Struct(
+    '<30s30s2i'             # smVersion, acVersion, numberOfSessions, numCars
+    '66s66s66s66s66s'       # carModel, track, playerName, playerSurname, playerNick
+    'i8xif'                 # sectorCount, maxTorque, maxPower, maxRpm, maxFuel
+)
+
+
+def _decode_wchar(raw: bytes) -> str:
+    """Decodifica una cadena wchar_t de la memoria compartida"""
+    return raw.decode('utf-16-le', errors='ignore').rstrip('\x00')
+
+
 class ACCTelemetry:
     """Clase para leer telemetría de ACC mediante Shared Memory"""
     
@@ -17,11 +58,28 @@ class ACCTelemetry:
     GRAPHICS_MAP = "Local\\acpmf_graphics"
     STATIC_MAP = "Local\\acpmf_static"
     
+    # Bytes de SPageFilePhysics que decodifica parse_player_telemetry (hasta clutch)
+    PHYSICS_RECORD_SIZE = _PHYSICS_RECORD.size  # 364
+    # Offset de speedKmh (float) dentro de SPageFilePhysics
+    PHYSICS_SPEED_OFFSET = 28
+    
+    # Valores de ACC_STATUS (SPageFileGraphic.status, offset 4)
+    SESSION_STATUSES = {
+        0: 'Off',
+        1: 'Replay',
+        2: 'Live',
+        3: 'Pause'
+    }
+    
     def __init__(self):
         self.physics_handle = None
         self.graphics_handle = None
         self.static_handle = None
         self.connected = False
+        # Última info del coche y los bytes de los que salió: SPageFileStatic
+        # apenas cambia y así no se decodifican sus cadenas en cada muestra
+        self._car_info_raw: Optional[bytes] = None
+        self._car_info: Optional[Dict] = None
         
     def connect(self) -> bool:
         """Conecta con la memoria compartida de ACC"""
@@ -47,44 +105,41 @@ class ACCTelemetry:
             self.static_handle.close()
         self.connected = False
     
+    def get_session_status(self) -> Optional[str]:
+        """
+        Lee solo el estado de ACC, sin decodificar toda la página de gráficos
+        
+        Returns:
+            'Off', 'Replay', 'Live', 'Pause' o None si no hay conexión
+        """
+        if not self.connected:
+            return None
+        
+        try:
+            status = _GRAPHICS_STATUS.unpack_from(self.graphics_handle, 4)[0]
+            return self.SESSION_STATUSES.get(status, 'Unknown')
+        except Exception as e:
+            print(f"Error leyendo session status: {e}")
+            return None
+    
     def get_session_info(self) -> Optional[Dict]:
         """Obtiene información de la sesión actual"""
         if not self.connected:
             return None
             
         try:
-            self.graphics_handle.seek(0)
-            data = self.graphics_handle.read(4096)
-            
-            offset = 0
-            
-            packet_id = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            status = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            session = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            
-            # wchar_t[15] = 30 bytes
-            current_time = data[offset:offset+30].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 30
-            last_time = data[offset:offset+30].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 30
-            best_time = data[offset:offset+30].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 30
-            split = data[offset:offset+30].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 30
-            
-            completed_laps = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            position = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            i_current_time = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            i_last_time = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            i_best_time = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            session_time_left = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            distance_traveled = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            is_in_pit = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            current_sector = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            last_sector_time = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            number_of_laps = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            
-            # wchar_t[33] = 66 bytes
-            tyre_compound = data[offset:offset+66].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 66
-            
-            offset += 4  # replayMult
-            normalized_pos = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
+            (packet_id, status, session,
+             current_time, last_time, best_time, split,
+             completed_laps, position, i_current_time, i_last_time, i_best_time,
+             session_time_left, distance_traveled,
+             is_in_pit, current_sector, last_sector_time, number_of_laps,
+             tyre_compound, normalized_pos) = _GRAPHICS_SESSION.unpack_from(self.graphics_handle, 0)
+            
+            current_time = _decode_wchar(current_time)
+            last_time = _decode_wchar(last_time)
+            best_time = _decode_wchar(best_time)
+            split = _decode_wchar(split)
+            tyre_compound = _decode_wchar(tyre_compound)
             
             session_types = {
                 0: 'Unknown',
@@ -97,16 +152,9 @@ class ACCTelemetry:
                 7: 'Drag'
             }
             
-            statuses = {
-                0: 'Off',
-                1: 'Replay',
-                2: 'Live',
-                3: 'Pause'
-            }
-            
             return {
                 'packet_id': packet_id,
-                'status': statuses.get(status, 'Unknown'),
+                'status': self.SESSION_STATUSES.get(status, 'Unknown'),
                 'session_type': session_types.get(session, 'Unknown'),
                 'current_time': current_time,
                 'last_time': last_time,
@@ -157,230 +205,155 @@ class ACCTelemetry:
             return None
         
         try:
-            self.physics_handle.seek(0)
-            data = self.physics_handle.read(4096)
-            
-            offset = 0
-            
-            # Estructura C++ exacta con pack(4)
-            packet_id = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            gas = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            brake = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            fuel = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            gear = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            rpms = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            steer_angle = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            speed_kmh = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # velocity[3]
-            velocity_x = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            velocity_y = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            velocity_z = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # accG[3]
-            accg_x = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            accg_y = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            accg_z = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # wheelSlip[4]
-            wheel_slip_fl = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            wheel_slip_fr = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            wheel_slip_rl = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            wheel_slip_rr = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # wheelLoad[4]
-            wheel_load_fl = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            wheel_load_fr = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            wheel_load_rl = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            wheel_load_rr = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # wheelsPressure[4]
-            tyre_pressure_fl = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            tyre_pressure_fr = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            tyre_pressure_rl = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            tyre_pressure_rr = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # wheelAngularSpeed[4]
-            wheel_angular_fl = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            wheel_angular_fr = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            wheel_angular_rl = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            wheel_angular_rr = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # tyreWear[4]
-            tyre_wear_fl = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            tyre_wear_fr = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            tyre_wear_rl = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            tyre_wear_rr = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # tyreDirtyLevel[4]
-            offset += 16  # Saltar dirty level
-            
-            # tyreCoreTemperature[4]
-            tyre_temp_fl = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            tyre_temp_fr = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            tyre_temp_rl = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            tyre_temp_rr = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # camberRAD[4]
-            offset += 16
-            
-            # suspensionTravel[4]
-            susp_travel_fl = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            susp_travel_fr = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            susp_travel_rl = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            susp_travel_rr = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            offset += 4  # drs
-            tc = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            heading = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            pitch = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            roll = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            offset += 4  # cgHeight
-            
-            # carDamage[5]
-            offset += 20
-            
-            offset += 4  # tyresOut
-            offset += 4  # pitLimiter
-            abs_level = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # kersCharge, kersInput (not used in ACC)
-            offset += 8
-            
-            offset += 4  # autoShifter
+            # unpack_from lee del mmap en sitio, sin copiar la página
+            return self.parse_player_telemetry(self.physics_handle)
             
-            # rideHeight[2]
-            offset += 8
-            
-            turbo_boost = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            offset += 4  # ballast
-            air_density = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            air_temp = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            road_temp = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # localAngularVel[3]
-            offset += 12
-            
-            offset += 4  # finalFF
-            offset += 4  # perfMeter
-            
-            # engineBrake, ers fields (not used in ACC) - 6 ints + 1 float = 28 bytes
-            offset += 28
-            
-            # brakeTemp[4]
-            brake_temp_fl = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            brake_temp_fr = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            brake_temp_rl = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            brake_temp_rr = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            clutch = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # Detectar bloqueos de rueda
-            wheel_lock_fl = wheel_slip_fl > 1.2
-            wheel_lock_fr = wheel_slip_fr > 1.2
-            wheel_lock_rl = wheel_slip_rl > 1.2
-            wheel_lock_rr = wheel_slip_rr > 1.2
-            
-            return {
-                'packet_id': packet_id,
-                'gas': round(gas, 3),
-                'brake': round(brake, 3),
-                'fuel': round(fuel, 2),
-                'gear': gear,
-                'rpm': rpms,
-                'steer_angle': round(steer_angle, 2),
-                'speed_kmh': round(speed_kmh, 1),
-                'velocity': {
-                    'x': round(velocity_x, 2),
-                    'y': round(velocity_y, 2),
-                    'z': round(velocity_z, 2)
-                },
-                'g_force': {
-                    'lateral': round(accg_x, 2),
-                    'longitudinal': round(accg_z, 2),
-                    'vertical': round(accg_y, 2)
-                },
-                'tyres': {
-                    'slip': {
-                        'front_left': round(wheel_slip_fl, 3),
-                        'front_right': round(wheel_slip_fr, 3),
-                        'rear_left': round(wheel_slip_rl, 3),
-                        'rear_right': round(wheel_slip_rr, 3)
-                    },
-                    'locked': {
-                        'front_left': wheel_lock_fl,
-                        'front_right': wheel_lock_fr,
-                        'rear_left': wheel_lock_rl,
-                        'rear_right': wheel_lock_rr
-                    },
-                    'temperature': {
-                        'front_left': round(tyre_temp_fl, 1),
-                        'front_right': round(tyre_temp_fr, 1),
-                        'rear_left': round(tyre_temp_rl, 1),
-                        'rear_right': round(tyre_temp_rr, 1)
-                    },
-                    'pressure': {
-                        'front_left': round(tyre_pressure_fl, 2),
-                        'front_right': round(tyre_pressure_fr, 2),
-                        'rear_left': round(tyre_pressure_rl, 2),
-                        'rear_right': round(tyre_pressure_rr, 2)
-                    },
-                    'wear': {
-                        'front_left': round(tyre_wear_fl, 3),
-                        'front_right': round(tyre_wear_fr, 3),
-                        'rear_left': round(tyre_wear_rl, 3),
-                        'rear_right': round(tyre_wear_rr, 3)
-                    },
-                    'angular_speed': {
-                        'front_left': round(wheel_angular_fl, 1),
-                        'front_right': round(wheel_angular_fr, 1),
-                        'rear_left': round(wheel_angular_rl, 1),
-                        'rear_right': round(wheel_angular_rr, 1)
-                    },
-                    'load': {
-                        'front_left': round(wheel_load_fl, 1),
-                        'front_right': round(wheel_load_fr, 1),
-                        'rear_left': round(wheel_load_rl, 1),
-                        'rear_right': round(wheel_load_rr, 1)
-                    }
+        except Exception as e:
+            print(f"Error leyendo telemetría: {e}")
+            return None
+    
+    def get_player_telemetry_raw(self) -> Optional[bytes]:
+        """
+        Copia cruda de la parte de SPageFilePhysics que usa get_player_telemetry
+        
+        Returns:
+            PHYSICS_RECORD_SIZE bytes sin decodificar (ver parse_player_telemetry)
+        """
+        if not self.connected:
+            return None
+        
+        try:
+            return self.physics_handle[:self.PHYSICS_RECORD_SIZE]
+        except Exception as e:
+            print(f"Error leyendo telemetría: {e}")
+            return None
+    
+    @staticmethod
+    def parse_player_telemetry(data: bytes) -> Dict:
+        """
+        Decodifica un bloque de SPageFilePhysics en el dict de telemetría del jugador
+        
+        Args:
+            data: Bytes o mmap de la memoria de física (al menos PHYSICS_RECORD_SIZE)
+        """
+        (packet_id, gas, brake, fuel, gear, rpms, steer_angle, speed_kmh,
+         velocity_x, velocity_y, velocity_z,
+         accg_x, accg_y, accg_z,
+         wheel_slip_fl, wheel_slip_fr, wheel_slip_rl, wheel_slip_rr,
+         wheel_load_fl, wheel_load_fr, wheel_load_rl, wheel_load_rr,
+         tyre_pressure_fl, tyre_pressure_fr, tyre_pressure_rl, tyre_pressure_rr,
+         wheel_angular_fl, wheel_angular_fr, wheel_angular_rl, wheel_angular_rr,
+         tyre_wear_fl, tyre_wear_fr, tyre_wear_rl, tyre_wear_rr,
+         tyre_temp_fl, tyre_temp_fr, tyre_temp_rl, tyre_temp_rr,
+         susp_travel_fl, susp_travel_fr, susp_travel_rl, susp_travel_rr,
+         tc, heading, pitch, roll,
+         abs_level,
+         turbo_boost, air_density, air_temp, road_temp,
+         brake_temp_fl, brake_temp_fr, brake_temp_rl, brake_temp_rr,
+         clutch) = _PHYSICS_RECORD.unpack_from(data, 0)
+        
+        # Detectar bloqueos de rueda
+        wheel_lock_fl = wheel_slip_fl > 1.2
+        wheel_lock_fr = wheel_slip_fr > 1.2
+        wheel_lock_rl = wheel_slip_rl > 1.2
+        wheel_lock_rr = wheel_slip_rr > 1.2
+        
+        return {
+            'packet_id': packet_id,
+            'gas': round(gas, 3),
+            'brake': round(brake, 3),
+            'fuel': round(fuel, 2),
+            'gear': gear,
+            'rpm': rpms,
+            'steer_angle': round(steer_angle, 2),
+            'speed_kmh': round(speed_kmh, 1),
+            'velocity': {
+                'x': round(velocity_x, 2),
+                'y': round(velocity_y, 2),
+                'z': round(velocity_z, 2)
+            },
+            'g_force': {
+                'lateral': round(accg_x, 2),
+                'longitudinal': round(accg_z, 2),
+                'vertical': round(accg_y, 2)
+            },
+            'tyres': {
+                'slip': {
+                    'front_left': round(wheel_slip_fl, 3),
+                    'front_right': round(wheel_slip_fr, 3),
+                    'rear_left': round(wheel_slip_rl, 3),
+                    'rear_right': round(wheel_slip_rr, 3)
                 },
-                'brakes': {
-                    'temperature': {
-                        'front_left': round(brake_temp_fl, 1),
-                        'front_right': round(brake_temp_fr, 1),
-                        'rear_left': round(brake_temp_rl, 1),
-                        'rear_right': round(brake_temp_rr, 1)
-                    }
+                'locked': {
+                    'front_left': wheel_lock_fl,
+                    'front_right': wheel_lock_fr,
+                    'rear_left': wheel_lock_rl,
+                    'rear_right': wheel_lock_rr
                 },
-                'suspension': {
-                    'travel': {
-                        'front_left': round(susp_travel_fl, 3),
-                        'front_right': round(susp_travel_fr, 3),
-                        'rear_left': round(susp_travel_rl, 3),
-                        'rear_right': round(susp_travel_rr, 3)
-                    }
+                'temperature': {
+                    'front_left': round(tyre_temp_fl, 1),
+                    'front_right': round(tyre_temp_fr, 1),
+                    'rear_left': round(tyre_temp_rl, 1),
+                    'rear_right': round(tyre_temp_rr, 1)
                 },
-                'electronics': {
-                    'tc': round(tc, 2),
-                    'abs': round(abs_level, 2),
-                    'clutch': round(clutch, 2)
+                'pressure': {
+                    'front_left': round(tyre_pressure_fl, 2),
+                    'front_right': round(tyre_pressure_fr, 2),
+                    'rear_left': round(tyre_pressure_rl, 2),
+                    'rear_right': round(tyre_pressure_rr, 2)
                 },
-                'orientation': {
-                    'heading': round(heading, 2),
-                    'pitch': round(pitch, 2),
-                    'roll': round(roll, 2)
+                'wear': {
+                    'front_left': round(tyre_wear_fl, 3),
+                    'front_right': round(tyre_wear_fr, 3),
+                    'rear_left': round(tyre_wear_rl, 3),
+                    'rear_right': round(tyre_wear_rr, 3)
                 },
-                'environment': {
-                    'air_temp': round(air_temp, 1),
-                    'road_temp': round(road_temp, 1),
-                    'air_density': round(air_density, 3)
+                'angular_speed': {
+                    'front_left': round(wheel_angular_fl, 1),
+                    'front_right': round(wheel_angular_fr, 1),
+                    'rear_left': round(wheel_angular_rl, 1),
+                    'rear_right': round(wheel_angular_rr, 1)
                 },
-                'turbo_boost': round(turbo_boost, 2)
-            }
-            
-        except Exception as e:
-            print(f"Error leyendo telemetría: {e}")
-            return None
+                'load': {
+                    'front_left': round(wheel_load_fl, 1),
+                    'front_right': round(wheel_load_fr, 1),
+                    'rear_left': round(wheel_load_rl, 1),
+                    'rear_right': round(wheel_load_rr, 1)
+                }
+            },
+            'brakes': {
+                'temperature': {
+                    'front_left': round(brake_temp_fl, 1),
+                    'front_right': round(brake_temp_fr, 1),
+                    'rear_left': round(brake_temp_rl, 1),
+                    'rear_right': round(brake_temp_rr, 1)
+                }
+            },
+            'suspension': {
+                'travel': {
+                    'front_left': round(susp_travel_fl, 3),
+                    'front_right': round(susp_travel_fr, 3),
+                    'rear_left': round(susp_travel_rl, 3),
+                    'rear_right': round(susp_travel_rr, 3)
+                }
+            },
+            'electronics': {
+                'tc': round(tc, 2),
+                'abs': round(abs_level, 2),
+                'clutch': round(clutch, 2)
+            },
+            'orientation': {
+                'heading': round(heading, 2),
+                'pitch': round(pitch, 2),
+                'roll': round(roll, 2)
+            },
+            'environment': {
+                'air_temp': round(air_temp, 1),
+                'road_temp': round(road_temp, 1),
+                'air_density': round(air_density, 3)
+            },
+            'turbo_boost': round(turbo_boost, 2)
+        }
     
     def get_car_info(self) -> Optional[Dict]:
         """Obtiene información estática del coche según estructura C++ con pack(4)"""
@@ -388,38 +361,23 @@ class ACCTelemetry:
             return None
         
         try:
-            self.static_handle.seek(0)
-            data = self.static_handle.read(4096)
-            
-            offset = 0
-            
-            # wchar_t[15] = 30 bytes
-            sm_version = data[offset:offset+30].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 30
-            ac_version = data[offset:offset+30].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 30
-            
-            num_sessions = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            num_cars = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            
-            # wchar_t[33] = 66 bytes
-            car_model = data[offset:offset+66].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 66
-            track = data[offset:offset+66].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 66
-            player_name = data[offset:offset+66].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 66
-            player_surname = data[offset:offset+66].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 66
-            player_nick = data[offset:offset+66].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 66
-            
-            sector_count = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            offset += 4  # maxTorque
-            offset += 4  # maxPower
-            max_rpm = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            max_fuel = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # suspensionMaxTravel[4]
-            offset += 16
-            
-            # tyreRadius[4]
-            offset += 16
-            
-            return {
+            raw = self.static_handle[:_STATIC_CAR_INFO.size]
+            if raw == self._car_info_raw:
+                return dict(self._car_info)
+            
+            (sm_version, ac_version, num_sessions, num_cars,
+             car_model, track, player_name, player_surname, player_nick,
+             sector_count, max_rpm, max_fuel) = _STATIC_CAR_INFO.unpack(raw)
+            
+            sm_version = _decode_wchar(sm_version)
+            ac_version = _decode_wchar(ac_version)
+            car_model = _decode_wchar(car_model)
+            track = _decode_wchar(track)
+            player_name = _decode_wchar(player_name)
+            player_surname = _decode_wchar(player_surname)
+            player_nick = _decode_wchar(player_nick)
+            
+            self._car_info = {
                 'sm_version': sm_version,
                 'ac_version': ac_version,
                 'car_model': car_model,
@@ -432,6 +390,8 @@ class ACCTelemetry:
                 'num_cars': num_cars,
                 'sector_count': sector_count
             }
+            self._car_info_raw = raw
+            return dict(self._car_info)
             
         except Exception as e:
             print(f"Error leyendo info del coche: {e}")
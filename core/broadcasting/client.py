@@ -20,6 +20,27 @@ from .protocol import (
 )
 
 
+# Estructuras precompiladas del protocolo (little-endian, sin alineación)
+_UINT8 = struct.Struct('<B')
+_UINT16 = struct.Struct('<H')
+_INT32 = struct.Struct('<i')
+# REALTIME_UPDATE: eventIndex, sessionIndex, sessionType, phase, sessionTime, sessionEndTime, focusedCarIndex
+_REALTIME_UPDATE = struct.Struct('<HHBBffi')
+# REALTIME_UPDATE: replaySessionTime, replayRemainingTime (solo durante una repetición)
+_REPLAY_TIMES = struct.Struct('<ff')
+# REALTIME_UPDATE: timeOfDay, ambientTemp, trackTemp, clouds, rainLevel, wetness
+_WEATHER = struct.Struct('<fBBBBB')
+# REALTIME_CAR_UPDATE hasta delta (gear es con signo)
+_REALTIME_CAR_UPDATE = struct.Struct('<HHBbfffBHHHHfHi')
+# LapInfo: lapTimeMs, splits[3], flags de vuelta inválida, isValidForBest
+_LAP_INFO = struct.Struct('<4iBB')
+
+
+def _read(reader: BytesIO, layout: struct.Struct) -> tuple:
+    """Lee y desempaqueta la siguiente estructura del mensaje"""
+    return layout.unpack(reader.read(layout.size))
+
+
 class ACCBroadcastingClient:
     """Cliente para conectar con el Broadcasting SDK de ACC"""
     
@@ -166,27 +187,27 @@ class ACCBroadcastingClient:
         buffer = BytesIO()
         
         # Tipo de mensaje
-        buffer.write(struct.pack('B', OutboundMessageTypes.REGISTER_COMMAND_APPLICATION))
+        buffer.write(_UINT8.pack(OutboundMessageTypes.REGISTER_COMMAND_APPLICATION))
         
         # Versión del protocolo
-        buffer.write(struct.pack('B', self.BROADCASTING_PROTOCOL_VERSION))
+        buffer.write(_UINT8.pack(self.BROADCASTING_PROTOCOL_VERSION))
         
         # Display name (string con longitud)
         name_bytes = display_name.encode('utf-8')
-        buffer.write(struct.pack('B', len(name_bytes)))
+        buffer.write(_UINT8.pack(len(name_bytes)))
         buffer.write(name_bytes)
         
         # Connection password (string con longitud)
         pwd_bytes = password.encode('utf-8')
-        buffer.write(struct.pack('B', len(pwd_bytes)))
+        buffer.write(_UINT8.pack(len(pwd_bytes)))
         buffer.write(pwd_bytes)
         
         # Update interval
-        buffer.write(struct.pack('i', update_interval_ms))
+        buffer.write(_INT32.pack(update_interval_ms))
         
         # Command password (string con longitud)
         cmd_pwd_bytes = command_password.encode('utf-8')
-        buffer.write(struct.pack('B', len(cmd_pwd_bytes)))
+        buffer.write(_UINT8.pack(len(cmd_pwd_bytes)))
         buffer.write(cmd_pwd_bytes)
         
         self.socket.sendto(buffer.getvalue(), self.server_address)
@@ -194,22 +215,22 @@ class ACCBroadcastingClient:
     def _send_unregister_command(self):
         """Envía comando de desregistro"""
         buffer = BytesIO()
-        buffer.write(struct.pack('B', OutboundMessageTypes.UNREGISTER_COMMAND_APPLICATION))
-        buffer.write(struct.pack('i', 1))  # Connection ID
+        buffer.write(_UINT8.pack(OutboundMessageTypes.UNREGISTER_COMMAND_APPLICATION))
+        buffer.write(_INT32.pack(1))  # Connection ID
         self.socket.sendto(buffer.getvalue(), self.server_address)
     
     def _request_entry_list(self):
         """Solicita la lista de participantes"""
         buffer = BytesIO()
-        buffer.write(struct.pack('B', OutboundMessageTypes.REQUEST_ENTRY_LIST))
-        buffer.write(struct.pack('i', 1))  # Connection ID
+        buffer.write(_UINT8.pack(OutboundMessageTypes.REQUEST_ENTRY_LIST))
+        buffer.write(_INT32.pack(1))  # Connection ID
         self.socket.sendto(buffer.getvalue(), self.server_address)
     
     def _request_track_data(self):
         """Solicita información del circuito"""
         buffer = BytesIO()
-        buffer.write(struct.pack('B', OutboundMessageTypes.REQUEST_TRACK_DATA))
-        buffer.write(struct.pack('i', 1))  # Connection ID
+        buffer.write(_UINT8.pack(OutboundMessageTypes.REQUEST_TRACK_DATA))
+        buffer.write(_INT32.pack(1))  # Connection ID
         self.socket.sendto(buffer.getvalue(), self.server_address)
     
     def _receive_loop(self):
@@ -249,11 +270,11 @@ class ACCBroadcastingClient:
     def _process_registration_result(self, data: bytes):
         """Procesa resultado de registro"""
         reader = BytesIO(data[1:])
-        connection_id = struct.unpack('i', reader.read(4))[0]
-        success = struct.unpack('B', reader.read(1))[0]
-        is_readonly = struct.unpack('B', reader.read(1))[0]
+        connection_id = _read(reader, _INT32)[0]
+        success = _read(reader, _UINT8)[0]
+        is_readonly = _read(reader, _UINT8)[0]
         
-        err_msg_len = struct.unpack('B', reader.read(1))[0]
+        err_msg_len = _read(reader, _UINT8)[0]
         error_msg = ""
         if err_msg_len > 0:
             error_msg = reader.read(err_msg_len).decode('utf-8')
@@ -267,40 +288,31 @@ class ACCBroadcastingClient:
         """Procesa actualización de sesión en tiempo real"""
         reader = BytesIO(data[1:])
         
-        event_index = struct.unpack('H', reader.read(2))[0]
-        session_index = struct.unpack('H', reader.read(2))[0]
-        session_type = struct.unpack('B', reader.read(1))[0]
-        phase = struct.unpack('B', reader.read(1))[0]
-        
-        session_time = struct.unpack('f', reader.read(4))[0]
-        session_end_time = struct.unpack('f', reader.read(4))[0]
-        focused_car_index = struct.unpack('i', reader.read(4))[0]
+        (event_index, session_index, session_type, phase,
+         session_time, session_end_time, focused_car_index) = _read(reader, _REALTIME_UPDATE)
         
         # Camera set (string)
-        cam_set_len = struct.unpack('B', reader.read(1))[0]
+        cam_set_len = _read(reader, _UINT8)[0]
         active_camera_set = reader.read(cam_set_len).decode('utf-8') if cam_set_len > 0 else ""
         
         # Camera (string)
-        cam_len = struct.unpack('B', reader.read(1))[0]
+        cam_len = _read(reader, _UINT8)[0]
         active_camera = reader.read(cam_len).decode('utf-8') if cam_len > 0 else ""
         
         # HUD page (string)
-        hud_len = struct.unpack('B', reader.read(1))[0]
+        hud_len = _read(reader, _UINT8)[0]
         current_hud_page = reader.read(hud_len).decode('utf-8') if hud_len > 0 else ""
         
         # Replay
-        is_replay_playing = struct.unpack('B', reader.read(1))[0]
+        is_replay_playing = _read(reader, _UINT8)[0]
         
         if is_replay_playing:
-            replay_session_time = struct.unpack('f', reader.read(4))[0]
-            replay_remaining_time = struct.unpack('f', reader.read(4))[0]
+            replay_session_time, replay_remaining_time = _read(reader, _REPLAY_TIMES)
         
-        time_of_day = struct.unpack('f', reader.read(4))[0]
-        ambient_temp = struct.unpack('B', reader.read(1))[0]
-        track_temp = struct.unpack('B', reader.read(1))[0]
-        clouds = struct.unpack('B', reader.read(1))[0] / 10.0
-        rain_level = struct.unpack('B', reader.read(1))[0] / 10.0
-        wetness = struct.unpack('B', reader.read(1))[0] / 10.0
+        time_of_day, ambient_temp, track_temp, clouds, rain_level, wetness = _read(reader, _WEATHER)
+        clouds /= 10.0
+        rain_level /= 10.0
+        wetness /= 10.0
         
         # Best session lap
         best_session_lap = self._read_lap_info(reader)
@@ -329,21 +341,10 @@ class ACCBroadcastingClient:
         """Procesa actualización de coches en tiempo real"""
         reader = BytesIO(data[1:])
         
-        car_index = struct.unpack('H', reader.read(2))[0]
-        driver_index = struct.unpack('H', reader.read(2))[0]
-        driver_count = struct.unpack('B', reader.read(1))[0]
-        gear = struct.unpack('b', reader.read(1))[0]  # signed
-        world_pos_x = struct.unpack('f', reader.read(4))[0]
-        world_pos_y = struct.unpack('f', reader.read(4))[0]
-        yaw = struct.unpack('f', reader.read(4))[0]
-        car_location = struct.unpack('B', reader.read(1))[0]
-        kmh = struct.unpack('H', reader.read(2))[0]
-        position = struct.unpack('H', reader.read(2))[0]
-        cup_position = struct.unpack('H', reader.read(2))[0]
-        track_position = struct.unpack('H', reader.read(2))[0]
-        spline_position = struct.unpack('f', reader.read(4))[0]
-        laps = struct.unpack('H', reader.read(2))[0]
-        delta = struct.unpack('i', reader.read(4))[0]
+        (car_index, driver_index, driver_count, gear,
+         world_pos_x, world_pos_y, yaw, car_location, kmh,
+         position, cup_position, track_position, spline_position,
+         laps, delta) = _read(reader, _REALTIME_CAR_UPDATE)
         
         best_session_lap = self._read_lap_info(reader)
         last_lap = self._read_lap_info(reader)
@@ -376,49 +377,49 @@ class ACCBroadcastingClient:
         """Procesa lista de participantes"""
         reader = BytesIO(data[1:])
         
-        connection_id = struct.unpack('i', reader.read(4))[0]
-        car_entry_count = struct.unpack('H', reader.read(2))[0]
+        connection_id = _read(reader, _INT32)[0]
+        car_entry_count = _read(reader, _UINT16)[0]
         
         # Leer índices de coches
         for _ in range(car_entry_count):
-            car_index = struct.unpack('H', reader.read(2))[0]
+            car_index = _read(reader, _UINT16)[0]
             # Aquí solo recibimos los índices, los detalles vienen en ENTRY_LIST_CAR
     
     def _process_entry_list_car(self, data: bytes):
         """Procesa entrada de un coche específico"""
         reader = BytesIO(data[1:])
         
-        car_index = struct.unpack('H', reader.read(2))[0]
-        car_model_type = struct.unpack('B', reader.read(1))[0]
+        car_index = _read(reader, _UINT16)[0]
+        car_model_type = _read(reader, _UINT8)[0]
         
         # Team name
-        team_name_len = struct.unpack('B', reader.read(1))[0]
+        team_name_len = _read(reader, _UINT8)[0]
         team_name = reader.read(team_name_len).decode('utf-8') if team_name_len > 0 else ""
         
-        race_number = struct.unpack('i', reader.read(4))[0]
-        cup_category = struct.unpack('B', reader.read(1))[0]
-        current_driver_index = struct.unpack('B', reader.read(1))[0]
-        nationality = struct.unpack('H', reader.read(2))[0]
+        race_number = _read(reader, _INT32)[0]
+        cup_category = _read(reader, _UINT8)[0]
+        current_driver_index = _read(reader, _UINT8)[0]
+        nationality = _read(reader, _UINT16)[0]
         
         # Drivers
-        driver_count = struct.unpack('B', reader.read(1))[0]
+        driver_count = _read(reader, _UINT8)[0]
         drivers = []
         
         for _ in range(driver_count):
             # First name
-            fname_len = struct.unpack('B', reader.read(1))[0]
+            fname_len = _read(reader, _UINT8)[0]
             first_name = reader.read(fname_len).decode('utf-8') if fname_len > 0 else ""
             
             # Last name
-            lname_len = struct.unpack('B', reader.read(1))[0]
+            lname_len = _read(reader, _UINT8)[0]
             last_name = reader.read(lname_len).decode('utf-8') if lname_len > 0 else ""
             
             # Short name
-            sname_len = struct.unpack('B', reader.read(1))[0]
+            sname_len = _read(reader, _UINT8)[0]
             short_name = reader.read(sname_len).decode('utf-8') if sname_len > 0 else ""
             
-            category = struct.unpack('B', reader.read(1))[0]
-            driver_nationality = struct.unpack('H', reader.read(2))[0]
+            category = _read(reader, _UINT8)[0]
+            driver_nationality = _read(reader, _UINT16)[0]
             
             drivers.append({
                 'first_name': first_name,
@@ -445,28 +446,28 @@ class ACCBroadcastingClient:
         """Procesa información del circuito"""
         reader = BytesIO(data[1:])
         
-        connection_id = struct.unpack('i', reader.read(4))[0]
+        connection_id = _read(reader, _INT32)[0]
         
         # Track name
-        name_len = struct.unpack('B', reader.read(1))[0]
+        name_len = _read(reader, _UINT8)[0]
         track_name = reader.read(name_len).decode('utf-8') if name_len > 0 else ""
         
-        track_id = struct.unpack('i', reader.read(4))[0]
-        track_meters = struct.unpack('i', reader.read(4))[0]
+        track_id = _read(reader, _INT32)[0]
+        track_meters = _read(reader, _INT32)[0]
         
         # Camera sets
-        camera_set_count = struct.unpack('B', reader.read(1))[0]
+        camera_set_count = _read(reader, _UINT8)[0]
         camera_sets = []
         for _ in range(camera_set_count):
-            set_len = struct.unpack('B', reader.read(1))[0]
+            set_len = _read(reader, _UINT8)[0]
             camera_set = reader.read(set_len).decode('utf-8') if set_len > 0 else ""
             camera_sets.append(camera_set)
         
         # HUD pages
-        hud_page_count = struct.unpack('B', reader.read(1))[0]
+        hud_page_count = _read(reader, _UINT8)[0]
         hud_pages = []
         for _ in range(hud_page_count):
-            page_len = struct.unpack('B', reader.read(1))[0]
+            page_len = _read(reader, _UINT8)[0]
             hud_page = reader.read(page_len).decode('utf-8') if page_len > 0 else ""
             hud_pages.append(hud_page)
         
@@ -485,16 +486,8 @@ class ACCBroadcastingClient:
     
     def _read_lap_info(self, reader: BytesIO) -> Dict:
         """Lee información de una vuelta"""
-        lap_time_ms = struct.unpack('i', reader.read(4))[0]
-        
         # Splits (3 sectores)
-        splits = []
-        for _ in range(3):
-            split_ms = struct.unpack('i', reader.read(4))[0]
-            splits.append(split_ms)
-        
-        is_invalid = struct.unpack('B', reader.read(1))[0]
-        is_valid_for_best = struct.unpack('B', reader.read(1))[0]
+        lap_time_ms, *splits, is_invalid, is_valid_for_best = _read(reader, _LAP_INFO)
         
         # Flags
         is_out_lap = (is_invalid >> 0) & 1
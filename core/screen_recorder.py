@@ -598,13 +598,18 @@ class ScreenRecorder:
             
             time.sleep(1)
     
-    def list_audio_devices(self) -> List[str]:
+    def list_audio_devices(self, refresh: bool = False) -> List[str]:
         """
         Lista los dispositivos de audio disponibles
         
+        Args:
+            refresh: Ignorar la caché y volver a consultar a ffmpeg
+        
         Returns:
             Lista de nombres de dispositivos de audio
         """
+        if refresh:
+            self._devices_cache = None
         return self._get_audio_devices()
     
     def get_hardware_info(self) -> Dict[str, Any]:
@@ -51,6 +51,7 @@ class ACCSessionMonitor:
             'min_session_time_ms': 100,    # Tiempo mínimo de sesión para considerar inicio (ms)
             'update_interval': 0.5,        # Frecuencia de polling (segundos)
             'time_check_duration': 2.0,    # Segundos confirmando tiempo > 0
+            'off_check_interval': 2.0,     # Intervalo mínimo entre verificaciones con ACC cerrado (segundos)
         }
         
         # Callbacks
@@ -61,6 +62,7 @@ class ACCSessionMonitor:
         # Variables de detección
         self._session_time_positive_since: Optional[float] = None
         self._last_session_time_ms = 0
+        self._last_check_time = 0.0
         
     def configure(self, **kwargs) -> None:
         """
@@ -70,13 +72,18 @@ class ACCSessionMonitor:
             min_session_time_ms: Tiempo mínimo de sesión para inicio (ms)
             update_interval: Frecuencia de polling (segundos)
             time_check_duration: Tiempo confirmando session_time > 0 (segundos)
+            off_check_interval: Intervalo mínimo entre verificaciones con ACC cerrado (segundos)
         """
         self.config.update(kwargs)
     
-    def start_monitoring(self) -> bool:
+    def start_monitoring(self, threaded: bool = True) -> bool:
         """
         Inicia el monitoreo de sesiones
         
+        Args:
+            threaded: Si es True lanza un thread propio de polling; si es False
+                el llamador debe invocar poll() periódicamente (p.ej. un QTimer)
+        
         Returns:
             True si se inició correctamente, False en caso contrario
         """
@@ -88,11 +95,12 @@ class ACCSessionMonitor:
             return False
         
         self.is_monitoring = True
-        self.monitor_thread = threading.Thread(
-            target=self._monitoring_loop,
-            daemon=True
-        )
-        self.monitor_thread.start()
+        if threaded:
+            self.monitor_thread = threading.Thread(
+                target=self._monitoring_loop,
+                daemon=True
+            )
+            self.monitor_thread.start()
         
         return True
     
@@ -105,6 +113,16 @@ class ACCSessionMonitor:
         
         self.telemetry.disconnect()
     
+    def poll(self) -> None:
+        """Ejecuta una única verificación del estado de la sesión"""
+        if not self.is_monitoring:
+            return
+        
+        try:
+            self._check_session_state()
+        except Exception as e:
+            print(f"Error en monitoring poll: {e}")
+    
     def _monitoring_loop(self) -> None:
         """Loop principal de monitoreo (ejecuta en thread separado)"""
         while self.is_monitoring:
@@ -117,6 +135,20 @@ class ACCSessionMonitor:
     
     def _check_session_state(self) -> None:
         """Verifica el estado actual de la sesión"""
+        # Con ACC cerrado el resultado apenas cambia: reutilizar el último
+        # estado hasta que pase el intervalo mínimo
+        now = time.monotonic()
+        if (self.current_status == SessionStatus.OFF and
+                now - self._last_check_time < self.config['off_check_interval']):
+            return
+        self._last_check_time = now
+        
+        # Comprobación rápida: si ACC está cerrado y no hay carrera que
+        # cerrar, no hace falta decodificar toda la página de gráficos
+        if not self.is_in_race and self.telemetry.get_session_status() in (None, 'Off'):
+            self._update_status(SessionStatus.OFF)
+            return
+        
         # Obtener información de sesión
         session_info = self.telemetry.get_session_info()
         
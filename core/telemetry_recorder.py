@@ -3,26 +3,86 @@ Módulo para la grabación de telemetría de ACC con Broadcasting SDK integrado
 """
 
 import json
+import struct
 import threading
 import time
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Callable, Optional
+from typing import List, Dict, Any, Callable, Iterator, Optional, NamedTuple, Union
 
 from .acc_telemetry import ACCTelemetry
 from .broadcasting import ACCBroadcastingClient
 
 
+class TelemetryRecord(NamedTuple):
+    """
+    Frame completo de telemetría capturado por el grabador
+    
+    Se usa una tupla con campos en lugar de un dict por registro para evitar
+    la tabla hash de cada frame (decenas de miles por carrera). La física del
+    jugador se guarda como bytes crudos (~400 B) en lugar del árbol de dicts
+    decodificado, y se decodifica solo al leerla.
+    """
+    timestamp: str
+    player_physics: Optional[bytes]
+    session_info: Optional[Dict[str, Any]]
+    car_info: Optional[Dict[str, Any]]
+    standings: List[Dict[str, Any]]
+    track_data: Dict[str, Any]
+    broadcast_session: Dict[str, Any]
+    
+    @property
+    def player_telemetry(self) -> Optional[Dict[str, Any]]:
+        """Telemetría del jugador decodificada desde player_physics"""
+        if self.player_physics is None:
+            return None
+        return ACCTelemetry.parse_player_telemetry(self.player_physics)
+
+
+# Formato binario: cada registro es un timestamp (double, epoch) seguido de los
+# bytes crudos de SPageFilePhysics (ver ACCTelemetry.parse_player_telemetry)
+BINARY_HEADER = struct.Struct('<d')
+BINARY_RECORD_SIZE = BINARY_HEADER.size + ACCTelemetry.PHYSICS_RECORD_SIZE
+# Vista columnar (timestamp, speed_kmh) de un registro binario, para iter_unpack
+BINARY_SPEED_RECORD = struct.Struct(
+    f'<d{ACCTelemetry.PHYSICS_SPEED_OFFSET}xf'
+    f'{ACCTelemetry.PHYSICS_RECORD_SIZE - ACCTelemetry.PHYSICS_SPEED_OFFSET - 4}x'
+)
+
+
+def _record_as_dict(record: Union[TelemetryRecord, Dict[str, Any]]) -> Dict[str, Any]:
+    """Convierte un registro a dict para serializarlo o exportarlo"""
+    if isinstance(record, TelemetryRecord):
+        return {
+            'timestamp': record.timestamp,
+            'player_telemetry': record.player_telemetry,
+            'session_info': record.session_info,
+            'car_info': record.car_info,
+            'standings': record.standings,
+            'track_data': record.track_data,
+            'broadcast_session': record.broadcast_session
+        }
+    return record
+
+
 class TelemetryRecorder:
     """Gestiona la grabación de datos de telemetría de ACC"""
     
-    def __init__(self, output_dir: Path, enable_broadcasting: bool = True):
+    # Tope de la reserva previa de registros (segundos de grabación); por
+    # encima la lista crece con append como sin estimación
+    MAX_PREALLOCATED_SECONDS = 4 * 3600
+    
+    def __init__(self, output_dir: Path, enable_broadcasting: bool = True,
+                 binary_mode: bool = False):
         """
         Inicializa el grabador de telemetría
         
         Args:
             output_dir: Directorio base donde se guardarán las sesiones
             enable_broadcasting: Si True, habilita Broadcasting para obtener posiciones de pilotos
+            binary_mode: Si True, escribe los bytes crudos de física en telemetry.bin
+                (registros de ancho fijo) en lugar de telemetry.json; no incluye
+                sesión, coche ni clasificación por registro
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
@@ -30,8 +90,14 @@ class TelemetryRecorder:
         self.is_recording = False
         self.recording_thread: Optional[threading.Thread] = None
         self.telemetry_data: List[Dict[str, Any]] = []
+        self._record_count = 0
+        self._records_lock = threading.Lock()
         self.current_session_dir: Optional[Path] = None
         self.recording_start_time: Optional[datetime] = None
+        self._recording_start_mono = 0.0  # Reloj monotónico para la duración
+        
+        self.binary_mode = binary_mode
+        self._binary_file = None
         
         # Clientes de ACC
         self.acc_telemetry = ACCTelemetry()
@@ -50,11 +116,12 @@ class TelemetryRecorder:
         # Frecuencia de muestreo (Hz)
         self.sample_rate = 10  # 10 samples por segundo
         
-        # Callbacks
-        self.on_telemetry_update: Optional[Callable[[Dict[str, Any]], None]] = None
+        # Callbacks (on_telemetry_update recibe el TelemetryRecord, no un dict)
+        self.on_telemetry_update: Optional[Callable[[Union[TelemetryRecord, Dict[str, Any]]], None]] = None
         self.on_recording_started: Optional[Callable[[str], None]] = None
         self.on_recording_stopped: Optional[Callable[[int, float], None]] = None
         self.on_connection_status: Optional[Callable[[bool, bool], None]] = None
+        self.on_error: Optional[Callable[[str], None]] = None
         
     def set_broadcasting_config(self, ip: str = '127.0.0.1', port: int = 9000, 
                                password: str = 'asd', update_interval_ms: int = 250):
@@ -116,12 +183,16 @@ class TelemetryRecorder:
         
         self.acc_telemetry.disconnect()
     
-    def start_recording(self, session_name: Optional[str] = None) -> Path:
+    def start_recording(self, session_name: Optional[str] = None,
+                        expected_records: Optional[int] = None) -> Path:
         """
         Inicia la grabación de telemetría
         
         Args:
             session_name: Nombre personalizado para la sesión (opcional)
+            expected_records: Número estimado de registros; si se indica, la lista
+                se reserva de antemano para evitar redimensionados durante la carrera
+                (como mucho MAX_PREALLOCATED_SECONDS de muestras)
             
         Returns:
             Path al directorio de la sesión creada
@@ -135,9 +206,17 @@ class TelemetryRecorder:
             if not shmem_ok:
                 raise RuntimeError("No se pudo conectar a ACC. Asegúrate de que el juego esté corriendo.")
         
+        # Reservar antes de marcar la grabación como activa
+        max_records = self.MAX_PREALLOCATED_SECONDS * self.sample_rate
+        if expected_records and expected_records > 0:
+            self.telemetry_data = [None] * min(int(expected_records), max_records)
+        else:
+            self.telemetry_data = []
+        self._record_count = 0
+        
         self.is_recording = True
         self.recording_start_time = datetime.now()
-        self.telemetry_data = []
+        self._recording_start_mono = time.monotonic()
         
         # Crear nombre de sesión si no se proporciona
         if not session_name:
@@ -150,6 +229,10 @@ class TelemetryRecorder:
         # Guardar información inicial de sesión
         self._save_session_info()
         
+        if self.binary_mode:
+            self._save_binary_schema()
+            self._binary_file = open(self.current_session_dir / "telemetry.bin", 'wb')
+        
         # Iniciar thread de grabación
         self.recording_thread = threading.Thread(
             target=self._recording_loop,
@@ -170,12 +253,14 @@ class TelemetryRecorder:
         
         return self.current_session_dir
     
-    def stop_recording(self, keep_data: bool = False) -> tuple[int, float]:
+    def stop_recording(self, keep_data: bool = False, background: bool = False) -> tuple[int, float]:
         """
         Detiene la grabación y guarda los datos
         
         Args:
             keep_data: Si es True, mantiene los datos en memoria después de guardar
+            background: Si es True, la escritura a disco se hace en un hilo aparte y
+                on_recording_stopped se invoca desde ese hilo al terminar
         
         Returns:
             Tupla con (número de registros, duración en segundos)
@@ -189,57 +274,139 @@ class TelemetryRecorder:
         if self.recording_thread and self.recording_thread.is_alive():
             self.recording_thread.join(timeout=2.0)
         
-        # Guardar telemetría
-        records_count = len(self.telemetry_data)
+        # Bajo el lock: si el join expiró, el thread aún puede estar escribiendo
+        with self._records_lock:
+            # Recortar la parte reservada que no se llegó a usar
+            del self.telemetry_data[self._record_count:]
+            
+            if self._binary_file:
+                self._binary_file.close()
+                self._binary_file = None
+        
+        records_count = self._record_count
         duration = 0.0
+        session_dir = self.current_session_dir
         
-        if self.current_session_dir and self.telemetry_data:
-            telemetry_file = self.current_session_dir / "telemetry.json"
-            self._save_telemetry(telemetry_file)
-            
-            if self.recording_start_time:
-                duration = (datetime.now() - self.recording_start_time).total_seconds()
+        if session_dir and records_count:
+            duration = self.elapsed_seconds
             
-            # Guardar resumen de sesión
-            self._save_session_summary(records_count, duration)
+            summary = self._build_session_summary(records_count, duration)
+            data = None if self.binary_mode else self.telemetry_data
             
-            print(f"\n✅ Grabación finalizada:")
-            print(f"   Registros: {records_count}")
-            print(f"   Duración: {duration:.1f}s")
-            print(f"   Guardado en: {self.current_session_dir}")
-        
-        # Notificar finalización
-        if self.on_recording_stopped:
+            # Guardar telemetría y resumen de sesión
+            if background:
+                threading.Thread(
+                    target=self._finalize_session,
+                    args=(session_dir, data, summary, True)
+                ).start()
+            else:
+                self._finalize_session(session_dir, data, summary)
+        elif self.on_recording_stopped:
             self.on_recording_stopped(records_count, duration)
         
         # Limpiar (pero mantener datos si se solicita)
         if not keep_data:
             self.telemetry_data = []
+            self._record_count = 0
         self.current_session_dir = None
         self.recording_start_time = None
         
         return records_count, duration
     
-    def add_telemetry_record(self, data: Dict[str, Any]) -> None:
+    def _finalize_session(self, session_dir: Path, data: Optional[list],
+                          summary: Dict[str, Any], background: bool = False) -> None:
+        """
+        Escribe telemetría y resumen a disco y notifica on_recording_stopped
+        
+        Args:
+            session_dir: Directorio de la sesión
+            data: Registros a guardar en telemetry.json (None en modo binario)
+            summary: Resumen de sesión ya construido
+            background: Si es True, los errores se notifican por on_error en lugar de lanzarse
+        """
+        try:
+            if data is not None:
+                self._save_telemetry(session_dir / "telemetry.json", data)
+            self._save_session_summary(session_dir, summary)
+        except Exception as e:
+            if not background:
+                raise
+            if self.on_error:
+                self.on_error(str(e))
+            return
+        
+        print(f"\n✅ Grabación finalizada:")
+        print(f"   Registros: {summary['records_count']}")
+        print(f"   Duración: {summary['duration_seconds']:.1f}s")
+        print(f"   Guardado en: {session_dir}")
+        
+        # Notificar finalización
+        if self.on_recording_stopped:
+            self.on_recording_stopped(summary['records_count'], summary['duration_seconds'])
+    
+    def add_telemetry_record(self, data: Union[TelemetryRecord, Dict[str, Any]]) -> None:
         """
         Añade un registro de telemetría
         
         Args:
-            data: Diccionario con los datos de telemetría
+            data: TelemetryRecord o diccionario con los datos de telemetría
         """
         if not self.is_recording:
             return
         
         # Añadir timestamp si no existe
-        if 'timestamp' not in data:
+        if isinstance(data, dict) and 'timestamp' not in data:
             data['timestamp'] = datetime.now().isoformat()
         
-        self.telemetry_data.append(data)
+        with self._records_lock:
+            if not self.is_recording:
+                return  # stop_recording ya recortó la lista
+            if self._record_count < len(self.telemetry_data):
+                self.telemetry_data[self._record_count] = data
+            else:
+                self.telemetry_data.append(data)
+            self._record_count += 1
         
         # Notificar actualización
         if self.on_telemetry_update:
             self.on_telemetry_update(data)
     
+    def add_raw_record(self, raw: bytes) -> None:
+        """
+        Añade un registro en modo binario (sin decodificar)
+        
+        Args:
+            raw: Bytes de física devueltos por ACCTelemetry.get_player_telemetry_raw
+        """
+        if not self.is_recording:
+            return
+        
+        with self._records_lock:
+            binary_file = self._binary_file
+            if binary_file is None:
+                return  # stop_recording ya cerró el archivo
+            binary_file.write(BINARY_HEADER.pack(time.time()))
+            binary_file.write(raw)
+            self._record_count += 1
+    
+    @property
+    def elapsed_seconds(self) -> float:
+        """Segundos transcurridos desde el inicio de la grabación (reloj monotónico)"""
+        if not self.recording_start_time:
+            return 0.0
+        return time.monotonic() - self._recording_start_mono
+    
+    @property
+    def records_count(self) -> int:
+        """Número de registros escritos en la grabación actual"""
+        return self._record_count
+    
+    def _recorded_data(self) -> List[Dict[str, Any]]:
+        """Devuelve solo los registros escritos (sin la parte reservada vacía)"""
+        if self._record_count == len(self.telemetry_data):
+            return self.telemetry_data
+        return self.telemetry_data[:self._record_count]
+    
     def get_current_stats(self) -> Dict[str, Any]:
         """
         Obtiene estadísticas de la grabación actual
@@ -249,16 +416,13 @@ class TelemetryRecorder:
         """
         stats = {
             'is_recording': self.is_recording,
-            'records_count': len(self.telemetry_data),
-            'duration': 0.0,
+            'records_count': self.records_count,
+            'duration': self.elapsed_seconds,
             'session_dir': str(self.current_session_dir) if self.current_session_dir else None,
             'shared_memory_connected': self.acc_telemetry.connected,
             'broadcasting_connected': self.broadcasting_client.connected if self.broadcasting_client else False
         }
         
-        if self.recording_start_time:
-            stats['duration'] = (datetime.now() - self.recording_start_time).total_seconds()
-        
         return stats
     
     def _recording_loop(self) -> None:
@@ -271,11 +435,17 @@ class TelemetryRecorder:
             start_time = time.time()
             
             try:
-                # Capturar telemetría completa
-                telemetry_record = self._capture_telemetry()
-                
-                if telemetry_record:
-                    self.add_telemetry_record(telemetry_record)
+                if self.binary_mode:
+                    # Solo bytes crudos de física; se decodifican al analizar
+                    raw = self.acc_telemetry.get_player_telemetry_raw()
+                    if raw:
+                        self.add_raw_record(raw)
+                else:
+                    # Capturar telemetría completa
+                    telemetry_record = self._capture_telemetry()
+                    
+                    if telemetry_record:
+                        self.add_telemetry_record(telemetry_record)
                 
             except Exception as e:
                 print(f"Error capturando telemetría: {e}")
@@ -285,12 +455,12 @@ class TelemetryRecorder:
             sleep_time = max(0, sample_interval - elapsed)
             time.sleep(sleep_time)
     
-    def _capture_telemetry(self) -> Optional[Dict[str, Any]]:
+    def _capture_telemetry(self) -> Optional[TelemetryRecord]:
         """
         Captura un frame completo de telemetría de ACC
         
         Returns:
-            Diccionario con todos los datos de telemetría
+            TelemetryRecord con todos los datos de telemetría
         """
         if not self.acc_telemetry.connected:
             return None
@@ -298,8 +468,8 @@ class TelemetryRecorder:
         # Timestamp
         timestamp = datetime.now().isoformat()
         
-        # Datos del jugador (Shared Memory)
-        player_data = self.acc_telemetry.get_player_telemetry()
+        # Datos del jugador (Shared Memory, sin decodificar)
+        player_physics = self.acc_telemetry.get_player_telemetry_raw()
         session_info = self.acc_telemetry.get_session_info()
         car_info = self.acc_telemetry.get_car_info()
         
@@ -317,17 +487,15 @@ class TelemetryRecorder:
                 print(f"Error obteniendo datos de Broadcasting: {e}")
         
         # Construir registro completo
-        record = {
-            'timestamp': timestamp,
-            'player_telemetry': player_data,
-            'session_info': session_info,
-            'car_info': car_info,
-            'standings': standings,
-            'track_data': track_data,
-            'broadcast_session': broadcast_session
-        }
-        
-        return record
+        return TelemetryRecord(
+            timestamp=timestamp,
+            player_physics=player_physics,
+            session_info=session_info,
+            car_info=car_info,
+            standings=standings,
+            track_data=track_data,
+            broadcast_session=broadcast_session
+        )
     
     def _save_session_info(self) -> None:
         """Guarda información inicial de la sesión"""
@@ -350,14 +518,9 @@ class TelemetryRecorder:
         with open(session_info_file, 'w', encoding='utf-8') as f:
             json.dump(info, f, indent=2, ensure_ascii=False)
     
-    def _save_session_summary(self, records_count: int, duration: float) -> None:
-        """Guarda resumen de la sesión"""
-        if not self.current_session_dir:
-            return
-        
-        summary_file = self.current_session_dir / "summary.json"
-        
-        summary = {
+    def _build_session_summary(self, records_count: int, duration: float) -> Dict[str, Any]:
+        """Construye el resumen de la sesión actual"""
+        return {
             'session_name': self.current_session_dir.name,
             'start_time': self.recording_start_time.isoformat(),
             'end_time': datetime.now().isoformat(),
@@ -366,20 +529,46 @@ class TelemetryRecorder:
             'sample_rate': self.sample_rate,
             'broadcasting_enabled': self.enable_broadcasting and (self.broadcasting_client is not None)
         }
+    
+    def _save_session_summary(self, session_dir: Path, summary: Dict[str, Any]) -> None:
+        """Guarda resumen de la sesión"""
+        summary_file = session_dir / "summary.json"
         
         with open(summary_file, 'w', encoding='utf-8') as f:
             json.dump(summary, f, indent=2, ensure_ascii=False)
     
-    def _save_telemetry(self, filepath: Path) -> None:
+    def _save_binary_schema(self) -> None:
+        """Documenta el formato de telemetry.bin en telemetry.schema.json"""
+        schema = {
+            'format': 'acc-physics-raw',
+            'byte_order': 'little',
+            'record_size': BINARY_RECORD_SIZE,
+            'fields': [
+                {'name': 'timestamp', 'type': 'float64', 'offset': 0,
+                 'description': 'Segundos desde epoch (time.time())'},
+                {'name': 'physics', 'type': 'bytes', 'offset': BINARY_HEADER.size,
+                 'size': ACCTelemetry.PHYSICS_RECORD_SIZE,
+                 'description': 'SPageFilePhysics con pack(4), desde packetId hasta clutch'}
+            ]
+        }
+        
+        schema_file = self.current_session_dir / "telemetry.schema.json"
+        with open(schema_file, 'w', encoding='utf-8') as f:
+            json.dump(schema, f, indent=2, ensure_ascii=False)
+    
+    def _save_telemetry(self, filepath: Path, data: Optional[list] = None) -> None:
         """
-        Guarda los datos de telemetría en un archivo JSON
+        Guarda los datos de telemetría en un archivo JSON compacto
         
         Args:
             filepath: Ruta donde guardar el archivo
+            data: Registros a guardar (None = usar telemetry_data actual)
         """
+        records = data if data is not None else self.telemetry_data
         try:
             with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(self.telemetry_data, f, indent=2, ensure_ascii=False)
+                json.dump([_record_as_dict(r) for r in records], f,
+                          separators=(',', ':'), ensure_ascii=False)
         except Exception as e:
             raise IOError(f"Error al guardar telemetría: {str(e)}")
     
@@ -388,17 +577,97 @@ class TelemetryRecorder:
         Carga datos de telemetría desde un archivo
         
         Args:
-            filepath: Ruta al archivo de telemetría
+            filepath: Ruta al archivo de telemetría (.json o .bin)
             
         Returns:
             Lista de registros de telemetría
         """
         try:
+            if Path(filepath).suffix == '.bin':
+                return self._load_binary_telemetry(Path(filepath))
             with open(filepath, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except Exception as e:
             raise IOError(f"Error al cargar telemetría: {str(e)}")
     
+    def _load_binary_telemetry(self, filepath: Path) -> List[Dict[str, Any]]:
+        """Decodifica un telemetry.bin a la misma forma que los registros JSON"""
+        data = filepath.read_bytes()
+        records = []
+        
+        for start in range(0, len(data) - BINARY_RECORD_SIZE + 1, BINARY_RECORD_SIZE):
+            (ts,) = BINARY_HEADER.unpack_from(data, start)
+            physics = data[start + BINARY_HEADER.size:start + BINARY_RECORD_SIZE]
+            records.append({
+                'timestamp': datetime.fromtimestamp(ts).isoformat(),
+                'player_telemetry': ACCTelemetry.parse_player_telemetry(physics)
+            })
+        
+        return records
+    
+    @staticmethod
+    def iter_json_records(filepath: Path, chunk_size: int = 1 << 16) -> Iterator[Dict[str, Any]]:
+        """
+        Recorre los registros de un telemetry.json sin cargar el archivo entero
+        
+        Decodifica los elementos del array de uno en uno con raw_decode sobre
+        una ventana de texto que se rellena por bloques.
+        
+        Args:
+            filepath: Ruta al archivo JSON (array de registros)
+            chunk_size: Caracteres leídos por bloque
+            
+        Yields:
+            Cada registro del array
+        """
+        decoder = json.JSONDecoder()
+        
+        with open(filepath, 'r', encoding='utf-8') as f:
+            buffer = f.read(chunk_size).lstrip()
+            if not buffer.startswith('['):
+                raise ValueError("El archivo no contiene un array JSON")
+            pos = 1
+            eof = False
+            
+            while True:
+                # Saltar separadores entre elementos
+                while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                    pos += 1
+                
+                if pos < len(buffer) and buffer[pos] == ']':
+                    return
+                
+                try:
+                    if pos >= len(buffer):
+                        raise ValueError("buffer vacío")
+                    record, end = decoder.raw_decode(buffer, pos)
+                except ValueError:
+                    if eof:
+                        raise ValueError("JSON de telemetría truncado o inválido")
+                    chunk = f.read(chunk_size)
+                    eof = not chunk
+                    buffer = buffer[pos:] + chunk
+                    pos = 0
+                    continue
+                
+                yield record
+                pos = end
+    
+    @staticmethod
+    def load_binary_speeds(filepath: Path) -> List[tuple[float, float]]:
+        """
+        Lee solo las columnas timestamp y velocidad de un telemetry.bin
+        
+        Args:
+            filepath: Ruta al archivo .bin
+            
+        Returns:
+            Lista de tuplas (timestamp epoch, speed_kmh)
+        """
+        data = Path(filepath).read_bytes()
+        usable = len(data) - len(data) % BINARY_RECORD_SIZE
+        return list(BINARY_SPEED_RECORD.iter_unpack(memoryview(data)[:usable]))
+    
     def export_csv(self, filepath: Path, fields: Optional[List[str]] = None, 
                   data: Optional[List[Dict[str, Any]]] = None, flatten: bool = True) -> None:
         """
@@ -413,16 +682,16 @@ class TelemetryRecorder:
         import csv
         
         # Usar datos proporcionados o los datos actuales
-        export_data = data if data is not None else self.telemetry_data
+        export_data = data if data is not None else self._recorded_data()
         
         if not export_data:
             raise ValueError("No hay datos de telemetría para exportar")
         
         # Aplanar datos si es necesario
         if flatten:
-            flattened_data = [self._flatten_dict(record) for record in export_data]
+            flattened_data = [self._flatten_dict(_record_as_dict(record)) for record in export_data]
         else:
-            flattened_data = export_data
+            flattened_data = [_record_as_dict(record) for record in export_data]
         
         # Determinar campos
         if not fields:
@@ -475,12 +744,14 @@ class TelemetryRecorder:
         """
         import csv
         
-        if not self.telemetry_data:
+        recorded = self._recorded_data()
+        if not recorded:
             raise ValueError("No hay datos de telemetría")
         
         # Extraer todos los standings únicos
         all_standings = []
-        for record in self.telemetry_data:
+        for record in recorded:
+            record = _record_as_dict(record)
             standings = record.get('standings', [])
             if standings:
                 for entry in standings:
@@ -5,10 +5,127 @@ Muestra cómo obtener telemetría completa de ACC incluyendo posiciones de pilot
 
 from core.acc_telemetry import ACCTelemetry
 from core.broadcasting import ACCBroadcastingClient
+import asyncio
 import time
 import json
 
 
+def render_standings(standings: list) -> str:
+    """Formatea la tabla de clasificación (top 10)"""
+    lines = [
+        "🏆 CLASIFICACIÓN:",
+        "-" * 80,
+        f"{'Pos':<5} {'Piloto':<30} {'#':<5} {'Vueltas':<8} {'Delta':<10}",
+        "-" * 80,
+    ]
+    
+    for entry in standings[:10]:  # Mostrar top 10
+        pos = entry['position']
+        name = entry['driver_name'][:28]
+        number = entry['car_number']
+        laps = entry['laps']
+        delta_ms = entry['delta']
+        delta_str = f"+{delta_ms/1000:.3f}s" if delta_ms > 0 else "Leader"
+        
+        lines.append(f"{pos:<5} {name:<30} {number:<5} {laps:<8} {delta_str:<10}")
+    
+    if len(standings) > 10:
+        lines.append(f"\n... y {len(standings) - 10} pilotos más")
+    
+    return "\n".join(lines)
+
+
+def read_shared_memory(telemetry: ACCTelemetry) -> tuple:
+    """Lectura bloqueante de Shared Memory (jugador, sesión, coche)"""
+    return (
+        telemetry.get_player_telemetry(),
+        telemetry.get_session_info(),
+        telemetry.get_car_info(),
+    )
+
+
+def read_broadcasting(broadcasting: ACCBroadcastingClient) -> tuple:
+    """Lectura bloqueante del Broadcasting (clasificación, circuito, sesión)"""
+    return (
+        broadcasting.get_standings(),
+        broadcasting.get_track_data(),
+        broadcasting.get_session_info(),
+    )
+
+
+async def display_loop(telemetry: ACCTelemetry, broadcasting: ACCBroadcastingClient):
+    """Refresca la pantalla una vez por segundo con los datos combinados"""
+    last_standings_hash = None
+    standings_text = ""
+    
+    while True:
+        # Shared Memory y Broadcasting se leen en paralelo en hilos separados
+        (player_data, session_info, car_info), (standings, track_data, broadcast_session) = \
+            await asyncio.gather(
+                asyncio.to_thread(read_shared_memory, telemetry),
+                asyncio.to_thread(read_broadcasting, broadcasting),
+            )
+        
+        # Limpiar pantalla
+        print("\033[H\033[J", end="")
+        
+        # MOSTRAR INFORMACIÓN DE SESIÓN
+        if session_info:
+            print(f"📊 SESIÓN: {session_info.get('session_type', 'Unknown')}")
+            print(f"⏱️  Tiempo restante: {session_info.get('session_time_left', 0):.1f}s")
+            print(f"🏁 Vueltas completadas: {session_info.get('completed_laps', 0)}")
+            print()
+        
+        # MOSTRAR INFORMACIÓN DEL CIRCUITO
+        if track_data:
+            print(f"🏎️  Circuito: {track_data.get('track_name', 'Unknown')}")
+            print(f"📏 Longitud: {track_data.get('track_meters', 0)} metros")
+            print()
+        
+        # MOSTRAR TU TELEMETRÍA
+        if player_data:
+            print("🎮 TU COCHE:")
+            print(f"   Velocidad: {player_data.get('speed_kmh', 0):.1f} km/h")
+            print(f"   Marcha: {player_data.get('gear', 0)}")
+            print(f"   RPM: {player_data.get('rpm', 0)}")
+            print(f"   Acelerador: {player_data.get('gas', 0)*100:.0f}%")
+            print(f"   Freno: {player_data.get('brake', 0)*100:.0f}%")
+            
+            # Temperaturas de neumáticos
+            tyres = player_data.get('tyres', {})
+            temps = tyres.get('temperature', {})
+            print(f"\n   🌡️  Temperaturas neumáticos:")
+            print(f"      FL: {temps.get('front_left', 0):.1f}°C  FR: {temps.get('front_right', 0):.1f}°C")
+            print(f"      RL: {temps.get('rear_left', 0):.1f}°C   RR: {temps.get('rear_right', 0):.1f}°C")
+            
+            # Presiones de neumáticos
+            pressures = tyres.get('pressure', {})
+            print(f"\n   📊 Presiones neumáticos:")
+            print(f"      FL: {pressures.get('front_left', 0):.2f} PSI  FR: {pressures.get('front_right', 0):.2f} PSI")
+            print(f"      RL: {pressures.get('rear_left', 0):.2f} PSI   RR: {pressures.get('rear_right', 0):.2f} PSI")
+            print()
+        
+        # MOSTRAR CLASIFICACIÓN (solo se reformatea si cambió algo)
+        if standings:
+            # Los mismos campos que imprime render_standings
+            standings_hash = hash(tuple(
+                (e['position'], e['driver_name'], e['car_number'], e['laps'], e['delta'])
+                for e in standings
+            ))
+            if standings_hash != last_standings_hash:
+                last_standings_hash = standings_hash
+                standings_text = render_standings(standings)
+            print(standings_text)
+        else:
+            print("⏳ Esperando datos de clasificación...")
+        
+        print("\n" + "="*80)
+        print("Presiona Ctrl+C para salir")
+        
+        # Esperar antes de actualizar
+        await asyncio.sleep(1)
+
+
 def main():
     print("=== ACC Recorder - Broadcasting + Shared Memory ===\n")
     
@@ -63,84 +180,8 @@ def main():
     print("="*80 + "\n")
     
     try:
-        while True:
-            # Datos de tu coche (Shared Memory)
-            player_data = telemetry.get_player_telemetry()
-            session_info = telemetry.get_session_info()
-            car_info = telemetry.get_car_info()
-            
-            # Datos de todos los coches (Broadcasting)
-            standings = broadcasting.get_standings()
-            track_data = broadcasting.get_track_data()
-            broadcast_session = broadcasting.get_session_info()
-            
-            # Limpiar pantalla
-            print("\033[H\033[J", end="")
-            
-            # MOSTRAR INFORMACIÓN DE SESIÓN
-            if session_info:
-                print(f"📊 SESIÓN: {session_info.get('session_type', 'Unknown')}")
-                print(f"⏱️  Tiempo restante: {session_info.get('session_time_left', 0):.1f}s")
-                print(f"🏁 Vueltas completadas: {session_info.get('completed_laps', 0)}")
-                print()
-            
-            # MOSTRAR INFORMACIÓN DEL CIRCUITO
-            if track_data:
-                print(f"🏎️  Circuito: {track_data.get('track_name', 'Unknown')}")
-                print(f"📏 Longitud: {track_data.get('track_meters', 0)} metros")
-                print()
-            
-            # MOSTRAR TU TELEMETRÍA
-            if player_data:
-                print("🎮 TU COCHE:")
-                print(f"   Velocidad: {player_data.get('speed_kmh', 0):.1f} km/h")
-                print(f"   Marcha: {player_data.get('gear', 0)}")
-                print(f"   RPM: {player_data.get('rpm', 0)}")
-                print(f"   Acelerador: {player_data.get('gas', 0)*100:.0f}%")
-                print(f"   Freno: {player_data.get('brake', 0)*100:.0f}%")
-                
-                # Temperaturas de neumáticos
-                tyres = player_data.get('tyres', {})
-                temps = tyres.get('temperature', {})
-                print(f"\n   🌡️  Temperaturas neumáticos:")
-                print(f"      FL: {temps.get('front_left', 0):.1f}°C  FR: {temps.get('front_right', 0):.1f}°C")
-                print(f"      RL: {temps.get('rear_left', 0):.1f}°C   RR: {temps.get('rear_right', 0):.1f}°C")
-                
-                # Presiones de neumáticos
-                pressures = tyres.get('pressure', {})
-                print(f"\n   📊 Presiones neumáticos:")
-                print(f"      FL: {pressures.get('front_left', 0):.2f} PSI  FR: {pressures.get('front_right', 0):.2f} PSI")
-                print(f"      RL: {pressures.get('rear_left', 0):.2f} PSI   RR: {pressures.get('rear_right', 0):.2f} PSI")
-                print()
-            
-            # MOSTRAR CLASIFICACIÓN
-            if standings:
-                print("🏆 CLASIFICACIÓN:")
-                print("-" * 80)
-                print(f"{'Pos':<5} {'Piloto':<30} {'#':<5} {'Vueltas':<8} {'Delta':<10}")
-                print("-" * 80)
-                
-                for entry in standings[:10]:  # Mostrar top 10
-                    pos = entry['position']
-                    name = entry['driver_name'][:28]
-                    number = entry['car_number']
-                    laps = entry['laps']
-                    delta_ms = entry['delta']
-                    delta_str = f"+{delta_ms/1000:.3f}s" if delta_ms > 0 else "Leader"
-                    
-                    print(f"{pos:<5} {name:<30} {number:<5} {laps:<8} {delta_str:<10}")
-                
-                if len(standings) > 10:
-                    print(f"\n... y {len(standings) - 10} pilotos más")
-            else:
-                print("⏳ Esperando datos de clasificación...")
-            
-            print("\n" + "="*80)
-            print("Presiona Ctrl+C para salir")
-            
-            # Esperar antes de actualizar
-            time.sleep(1)
-            
+        asyncio.run(display_loop(telemetry, broadcasting))
+    
     except KeyboardInterrupt:
         print("\n\n🛑 Deteniendo...")
     
@@ -4,21 +4,65 @@ Ventana principal de la aplicación
 
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                                QLabel, QFrame, QStackedWidget, QLineEdit)
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QElapsedTimer, QObject, Signal
 from PySide6.QtGui import QFont
 from pathlib import Path
 from datetime import datetime
 import sys
 import os
+import math
+from typing import Any, Dict, Union
 
 # Añadir el directorio raíz al path para imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from gui.widgets import SidebarButton
-from gui.tabs import ControlTab, SessionsTab, AnalyticsTab, SettingsTab, SharedMemoryTab
-from gui.tabs.telemetry_analysis_tab import TelemetryAnalysisTab
-from gui.styles import COLORS, SIDEBAR_STYLE, SEARCH_INPUT_STYLE
-from core import TelemetryRecorder, ScreenRecorder, ACCSessionMonitor, SessionStatus, ACCTelemetry
+from gui import tabs
+from gui.tabs.control_tab import ControlTab
+from gui.tabs.settings_tab import load_saved_config
+from gui.styles import (COLORS, SIDEBAR_STYLE, SEARCH_INPUT_STYLE, MAIN_WINDOW_STYLE,
+                        CONTENT_AREA_STYLE, SIDEBAR_HEADER_STYLE, SIDEBAR_AVATAR_STYLE,
+                        SIDEBAR_TITLE_STYLE, VERSION_LABEL_STYLE, PAGE_TITLE_STYLE)
+from core import (TelemetryRecorder, TelemetryRecord, ScreenRecorder, ACCSessionMonitor,
+                  SessionStatus, ACCTelemetry)
+
+
+# Títulos de página, en el orden de las pestañas del stack
+_PAGE_TITLES = ("CONTROL", "SESSIONS", "ANALYTICS", "TELEMETRY", "SHARED MEMORY", "SETTINGS")
+
+# Cadenas HH:MM:SS precalculadas para las dos primeras horas de grabación
+_DURATION_STRS = tuple(
+    f"{s // 3600:02d}:{(s % 3600) // 60:02d}:{s % 60:02d}" for s in range(7201)
+)
+
+
+def _format_duration(seconds: int) -> str:
+    """Formatea segundos como HH:MM:SS usando la tabla precalculada si es posible"""
+    if seconds < len(_DURATION_STRS):
+        return _DURATION_STRS[seconds]
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
+class SessionMonitorSignals(QObject):
+    """
+    Puente entre los callbacks de ACCSessionMonitor (hilo de monitoreo) y la GUI.
+    
+    Las señales se emiten desde el hilo del monitor; al vivir este objeto en el
+    hilo de la GUI, Qt encola automáticamente las llamadas a los slots conectados.
+    """
+    
+    race_started = Signal(dict)
+    race_ended = Signal(dict)
+    status_changed = Signal(object, object)  # (SessionStatus anterior, nuevo)
+
+
+class TelemetryRecorderSignals(QObject):
+    """Puente para los callbacks que TelemetryRecorder invoca desde su hilo de guardado"""
+    
+    recording_stopped = Signal(int, float)  # (registros, duración)
+    error = Signal(str)
 
 
 class MainWindow(QMainWindow):
@@ -44,7 +88,11 @@ class MainWindow(QMainWindow):
         
         # Configurar callbacks de telemetría
         self.telemetry_recorder.on_recording_started = self._on_telemetry_started
-        self.telemetry_recorder.on_recording_stopped = self._on_telemetry_stopped
+        self.recorder_signals = TelemetryRecorderSignals(self)
+        self.recorder_signals.recording_stopped.connect(self._on_telemetry_stopped)
+        self.recorder_signals.error.connect(self._on_telemetry_error)
+        self.telemetry_recorder.on_recording_stopped = self.recorder_signals.recording_stopped.emit
+        self.telemetry_recorder.on_error = self.recorder_signals.error.emit
         self.telemetry_recorder.on_telemetry_update = self._on_telemetry_update
         
         # Configurar callbacks de grabación de pantalla
@@ -52,18 +100,33 @@ class MainWindow(QMainWindow):
         self.screen_recorder.on_recording_stopped = self._on_screen_stopped
         self.screen_recorder.on_error = self._on_screen_error
         
-        # Configurar callbacks del monitor de sesiones
-        self.session_monitor.on_race_started = self._on_race_started
-        self.session_monitor.on_race_ended = self._on_race_ended
-        self.session_monitor.on_status_changed = self._on_status_changed
+        # Configurar callbacks del monitor de sesiones (vía señales, ver SessionMonitorSignals)
+        self.monitor_signals = SessionMonitorSignals(self)
+        self.monitor_signals.race_started.connect(self._on_race_started)
+        self.monitor_signals.race_ended.connect(self._on_race_ended)
+        self.monitor_signals.status_changed.connect(self._on_status_changed)
+        self.session_monitor.on_race_started = self.monitor_signals.race_started.emit
+        self.session_monitor.on_race_ended = self.monitor_signals.race_ended.emit
+        self.session_monitor.on_status_changed = self.monitor_signals.status_changed.emit
+        
+        # El polling del monitor corre en el hilo de la GUI, sin thread propio
+        self.monitor_timer = QTimer(self)
+        self.monitor_timer.setTimerType(Qt.CoarseTimer)
+        self.monitor_timer.setInterval(int(self.session_monitor.config['update_interval'] * 1000))
+        self.monitor_timer.timeout.connect(self.session_monitor.poll)
         
         # Setup
         self.setWindowTitle("ACC Race Recorder")
         self.setMinimumSize(1200, 800)
         self.setup_ui()
         
+        # Los ajustes guardados se aplican ya, no solo al volver a guardarlos
+        self._apply_saved_config()
+        
         # Timer para actualizar duración y telemetría
+        self._recording_clock = QElapsedTimer()
         self.timer = QTimer()
+        self.timer.setTimerType(Qt.CoarseTimer)
         self.timer.timeout.connect(self.update_ui)
         self.timer.start(1000)
         
@@ -86,7 +149,7 @@ class MainWindow(QMainWindow):
         
         central.setLayout(main_layout)
         
-        self.setStyleSheet(f"QMainWindow {{ background-color: {COLORS['bg_primary']}; }}")
+        self.setStyleSheet(MAIN_WINDOW_STYLE)
         
     def create_sidebar(self) -> QFrame:
         """Crea la barra lateral"""
@@ -108,6 +171,7 @@ class MainWindow(QMainWindow):
         nav_layout.setSpacing(4)
         
         self.nav_buttons = []
+        self._current_page = 0
         
         btn_control = SidebarButton("🏁", "CONTROL")
         btn_control.setChecked(True)
@@ -144,7 +208,7 @@ class MainWindow(QMainWindow):
         
         # Footer
         version = QLabel("VERSION 1.0.3")
-        version.setStyleSheet(f"color: {COLORS['text_light']}; font-size: 11px; padding: 20px; background: transparent; border: none;")
+        version.setStyleSheet(VERSION_LABEL_STYLE)
         version.setAlignment(Qt.AlignCenter)
         layout.addWidget(version)
         
@@ -154,23 +218,18 @@ class MainWindow(QMainWindow):
     def create_sidebar_header(self) -> QFrame:
         """Crea el header del sidebar"""
         header = QFrame()
-        header.setStyleSheet(f"background-color: white; border-bottom: 1px solid {COLORS['border']};")
+        header.setStyleSheet(SIDEBAR_HEADER_STYLE)
         
         layout = QVBoxLayout()
         layout.setContentsMargins(20, 24, 20, 24)
         
         avatar = QLabel("👤")
-        avatar.setStyleSheet(f"""
-            font-size: 32px;
-            background-color: {COLORS['bg_light']};
-            border-radius: 32px;
-            padding: 16px;
-        """)
+        avatar.setStyleSheet(SIDEBAR_AVATAR_STYLE)
         avatar.setAlignment(Qt.AlignCenter)
         avatar.setFixedSize(64, 64)
         
         title = QLabel("ACC\\nRECORDER")
-        title.setStyleSheet(f"color: {COLORS['text_primary']}; font-size: 16px; font-weight: 700; margin-top: 12px; background: transparent; border: none;")
+        title.setStyleSheet(SIDEBAR_TITLE_STYLE)
         title.setAlignment(Qt.AlignCenter)
         
         layout.addWidget(avatar, alignment=Qt.AlignCenter)
@@ -182,7 +241,7 @@ class MainWindow(QMainWindow):
     def create_content_area(self) -> QFrame:
         """Crea el área de contenido"""
         container = QFrame()
-        container.setStyleSheet(f"background-color: {COLORS['bg_primary']};")
+        container.setStyleSheet(CONTENT_AREA_STYLE)
         
         layout = QVBoxLayout()
         layout.setContentsMargins(32, 24, 32, 24)
@@ -195,26 +254,30 @@ class MainWindow(QMainWindow):
         # Pages
         self.pages = QStackedWidget()
         
-        # Crear pestañas
+        # Crear pestañas: CONTROL se construye siempre, el resto bajo demanda
         self.control_tab = ControlTab()
-        self.sessions_tab = SessionsTab(self.output_dir)
-        self.analytics_tab = AnalyticsTab(self.output_dir)
-        self.telemetry_tab = TelemetryAnalysisTab(self.output_dir)
-        self.shared_memory_tab = SharedMemoryTab()
-        self.settings_tab = SettingsTab(self.output_dir)
-        
-        # Conectar señales
         self.control_tab.start_monitoring_requested.connect(self.start_monitoring)
         self.control_tab.stop_monitoring_requested.connect(self.stop_monitoring)
-        self.sessions_tab.switch_to_analytics.connect(self.load_analytics_file)
-        self.settings_tab.config_saved.connect(self.on_config_saved)
+        
+        self.sessions_tab = None
+        self.analytics_tab = None
+        self.telemetry_tab = None
+        self.shared_memory_tab = None
+        self.settings_tab = None
+        
+        # índice -> (atributo, factoría)
+        self._tab_factories = {
+            1: ('sessions_tab', lambda: tabs.SessionsTab(self.output_dir)),
+            2: ('analytics_tab', lambda: tabs.AnalyticsTab(self.output_dir)),
+            3: ('telemetry_tab', lambda: tabs.TelemetryAnalysisTab(self.output_dir)),
+            4: ('shared_memory_tab', lambda: tabs.SharedMemoryTab()),
+            5: ('settings_tab', lambda: tabs.SettingsTab(self.output_dir)),
+        }
+        self._tab_instances = {0: self.control_tab}
         
         self.pages.addWidget(self.control_tab)
-        self.pages.addWidget(self.sessions_tab)
-        self.pages.addWidget(self.analytics_tab)
-        self.pages.addWidget(self.telemetry_tab)
-        self.pages.addWidget(self.shared_memory_tab)
-        self.pages.addWidget(self.settings_tab)
+        for _ in self._tab_factories:
+            self.pages.addWidget(QWidget())  # Placeholder hasta la primera visita
         
         layout.addWidget(self.pages)
         
@@ -230,8 +293,8 @@ class MainWindow(QMainWindow):
         layout.setSpacing(24)
         
         # Título
-        self.page_title = QLabel("CONTROL")
-        self.page_title.setStyleSheet(f"color: {COLORS['text_primary']}; font-size: 28px; font-weight: 700; background: transparent; border: none;")
+        self.page_title = QLabel(_PAGE_TITLES[0])
+        self.page_title.setStyleSheet(PAGE_TITLE_STYLE)
         
         layout.addWidget(self.page_title)
         layout.addStretch()
@@ -239,24 +302,71 @@ class MainWindow(QMainWindow):
         header.setLayout(layout)
         return header
     
+    def _ensure_page(self, index: int) -> QWidget:
+        """Devuelve la pestaña del índice dado, construyéndola si es la primera vez"""
+        tab = self._tab_instances.get(index)
+        if tab is not None:
+            return tab
+        
+        attr, factory = self._tab_factories[index]
+        tab = factory()
+        self._connect_tab_signals(attr, tab)
+        setattr(self, attr, tab)
+        self._tab_instances[index] = tab
+        
+        # Sustituir el placeholder manteniendo la posición en el stack
+        placeholder = self.pages.widget(index)
+        self.pages.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.pages.insertWidget(index, tab)
+        return tab
+    
+    def _connect_tab_signals(self, attr: str, tab: QWidget):
+        """Conecta las señales de una pestaña recién construida"""
+        if attr == 'sessions_tab':
+            tab.switch_to_analytics.connect(self.load_analytics_file)
+        elif attr == 'settings_tab':
+            tab.config_saved.connect(self.on_config_saved)
+    
     def switch_page(self, index: int):
         """Cambia de página"""
+        # Los botones son checkables: un clic sobre el activo lo desmarcaría
+        self.nav_buttons[index].setChecked(True)
+        if index == self._current_page:
+            return
+        
+        self._ensure_page(index)
         self.pages.setCurrentIndex(index)
         
-        # Actualizar navegación
-        for i, btn in enumerate(self.nav_buttons):
-            btn.setChecked(i == index)
+        # Actualizar navegación: solo cambian el botón saliente y el entrante
+        self.nav_buttons[self._current_page].setChecked(False)
+        self._current_page = index
         
         # Actualizar título
-        titles = ["CONTROL", "SESSIONS", "ANALYTICS", "TELEMETRY", "SHARED MEMORY", "SETTINGS"]
-        if index < len(titles):
-            self.page_title.setText(titles[index])
+        if index < len(_PAGE_TITLES) and self.page_title.text() != _PAGE_TITLES[index]:
+            self.page_title.setText(_PAGE_TITLES[index])
     
     def load_analytics_file(self, filepath: Path):
         """Carga un archivo en analytics y cambia a esa pestaña"""
-        self.analytics_tab.load_file(filepath)
+        self._ensure_page(2).load_file(filepath)
         self.switch_page(2)
     
+    def _apply_saved_config(self):
+        """Aplica al arrancar la configuración guardada en config.json"""
+        saved = load_saved_config()
+        if not saved:
+            return
+        
+        if 'output_dir' in saved:
+            try:
+                Path(saved['output_dir']).mkdir(exist_ok=True)
+            except OSError as e:
+                # Carpeta guardada inaccesible: mantener la actual
+                self.control_tab.log(f"⚠ Saved output folder unavailable: {e}")
+                del saved['output_dir']
+        
+        self.on_config_saved({'output_dir': self.output_dir, **saved})
+    
     def on_config_saved(self, config: dict):
         """Cuando se guarda la configuración"""
         self.output_dir = Path(config['output_dir'])
@@ -298,7 +408,8 @@ class MainWindow(QMainWindow):
         self.control_tab.log("✓ Monitoring started - Waiting for ACC race to begin...")
         
         # Iniciar monitor de sesiones
-        if self.session_monitor.start_monitoring():
+        if self.session_monitor.start_monitoring(threaded=False):
+            self.monitor_timer.start()
             self.control_tab.log("✓ Connected to ACC telemetry")
         else:
             self.control_tab.log("⚠ Could not connect to ACC - Make sure the game is running")
@@ -312,6 +423,7 @@ class MainWindow(QMainWindow):
             self.stop_recording()
         
         # Detener monitor de sesiones
+        self.monitor_timer.stop()
         self.session_monitor.stop_monitoring()
         
         self.control_tab.set_monitoring_active(False)
@@ -331,8 +443,16 @@ class MainWindow(QMainWindow):
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             session_name = f"ACC_{session_type}_{timestamp}"
             
+            # Estimar nº de registros a partir del tiempo restante (ACC lo da en ms)
+            session_info = race_data.get('session_info') or {}
+            time_left_s = session_info.get('session_time_left', 0) / 1000
+            expected_records = None
+            if 0 < time_left_s < math.inf:  # Descarta NaN e infinito (sesión sin límite)
+                expected_records = int(time_left_s * self.telemetry_recorder.sample_rate * 1.1)
+            
             # Iniciar grabación de telemetría
-            session_dir = self.telemetry_recorder.start_recording(session_name)
+            session_dir = self.telemetry_recorder.start_recording(session_name, expected_records)
+            self._recording_clock.start()
             
             # Iniciar grabación de pantalla EN EL DIRECTORIO DE SESIÓN
             video_filename = f"{session_name}.mp4"
@@ -357,38 +477,39 @@ class MainWindow(QMainWindow):
         except Exception as e:
             self.control_tab.log(f"⚠ Error stopping screen recording: {str(e)}")
         
-        # Detener grabación de telemetría
+        # Detener grabación de telemetría (el JSON se escribe en segundo plano)
         try:
-            self.telemetry_recorder.stop_recording()
+            self.telemetry_recorder.stop_recording(background=True)
         except Exception as e:
             self.control_tab.log(f"⚠ Error stopping telemetry recording: {str(e)}")
         
         self.control_tab.set_status("Waiting for Race", COLORS['status_monitoring'])
         self.control_tab.update_session_name("—")
         
-        self.sessions_tab.refresh_recordings()
-        
     def update_ui(self):
         """Actualiza la UI periódicamente"""
-        # Actualizar duración si está grabando
-        if self.telemetry_recorder.is_recording:
-            stats = self.telemetry_recorder.get_current_stats()
-            
-            elapsed = stats['duration']
-            hours = int(elapsed // 3600)
-            minutes = int((elapsed % 3600) // 60)
-            seconds = int(elapsed % 60)
-            
-            self.control_tab.update_duration(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
-            self.control_tab.update_records(stats['records_count'])
+        # Sin grabación no hay nada que actualizar
+        if not self.telemetry_recorder.is_recording:
+            return
+        
+        elapsed = self._recording_clock.elapsed() // 1000
+        self.control_tab.update_duration(_format_duration(elapsed))
+        self.control_tab.update_records(self.telemetry_recorder.records_count)
         
         # Capturar telemetría si está en carrera
-        if self.session_monitor.is_in_race and self.telemetry_recorder.is_recording:
+        if self.session_monitor.is_in_race:
             self._capture_telemetry()
     
     def _capture_telemetry(self):
         """Captura y guarda datos de telemetría"""
         try:
+            if self.telemetry_recorder.binary_mode:
+                # Modo binario: bytes crudos, sin construir dicts
+                raw = self.acc_telemetry.get_player_telemetry_raw()
+                if raw:
+                    self.telemetry_recorder.add_raw_record(raw)
+                return
+            
             # Obtener datos del jugador
             player_data = self.acc_telemetry.get_player_telemetry()
             if player_data:
@@ -442,8 +563,15 @@ class MainWindow(QMainWindow):
     def _on_telemetry_stopped(self, records_count: int, duration: float):
         """Callback cuando finaliza la grabación de telemetría"""
         self.control_tab.log(f"✓ Telemetry saved: {records_count} records ({duration:.0f}s)")
+        
+        if self.sessions_tab is not None:
+            self.sessions_tab.refresh_recordings()
+    
+    def _on_telemetry_error(self, error_msg: str):
+        """Callback cuando falla el guardado de la telemetría"""
+        self.control_tab.log(f"⚠ Error saving telemetry: {error_msg}")
     
-    def _on_telemetry_update(self, data: dict):
+    def _on_telemetry_update(self, data: Union[TelemetryRecord, Dict[str, Any]]):
         """Callback cuando se actualiza la telemetría"""
         # Aquí se podría actualizar UI en tiempo real si se necesita
         pass
@@ -2,6 +2,34 @@
 Estilos y colores centralizados para la aplicación
 """
 
+__all__ = [
+    'COLORS',
+    'PANEL_STYLE',
+    'PANEL_TITLE_STYLE',
+    'TEXT_EDIT_STYLE',
+    'COMBO_BOX_STYLE',
+    'TREE_WIDGET_STYLE',
+    'SEARCH_INPUT_STYLE',
+    'SIDEBAR_STYLE',
+    'SETTING_LABEL_STYLE',
+    'HINT_LABEL_STYLE',
+    'DIRECTORY_LABEL_STYLE',
+    'STATUS_LABEL_STYLE',
+    'MAIN_WINDOW_STYLE',
+    'CONTENT_AREA_STYLE',
+    'SIDEBAR_HEADER_STYLE',
+    'SIDEBAR_AVATAR_STYLE',
+    'SIDEBAR_TITLE_STYLE',
+    'VERSION_LABEL_STYLE',
+    'PAGE_TITLE_STYLE',
+    'TELEMETRY_INFO_STYLE',
+    'TELEMETRY_INFO_OK_STYLE',
+    'CONNECTION_OK_STYLE',
+    'CONNECTION_OFF_STYLE',
+    'SETTINGS_TAB_STYLE',
+    'FIELD_TABLE_STYLE',
+]
+
 # Paleta de colores
 COLORS = {
     'bg_primary': '#F7FAFC',
@@ -48,7 +76,7 @@ PANEL_TITLE_STYLE = """
 """
 
 TEXT_EDIT_STYLE = """
-    QTextEdit {
+    QTextEdit, QPlainTextEdit {
         background-color: #F7FAFC;
         border: 1px solid #E2E8F0;
         border-radius: 8px;
@@ -116,7 +144,7 @@ COMBO_BOX_STYLE = """
 """
 
 TREE_WIDGET_STYLE = """
-    QTreeWidget {
+    QTreeView {
         background-color: white;
         border: none;
         border-radius: 12px;
@@ -124,11 +152,11 @@ TREE_WIDGET_STYLE = """
         font-size: 13px;
         padding: 12px;
     }
-    QTreeWidget::item {
+    QTreeView::item {
         padding: 8px;
         border-bottom: 1px solid #F7FAFC;
     }
-    QTreeWidget::item:selected {
+    QTreeView::item:selected {
         background-color: #EDF2F7;
         color: #2D3748;
     }
@@ -177,6 +205,14 @@ HINT_LABEL_STYLE = """
     padding: 0;
 """
 
+# Estilo para la ruta del directorio de salida en Settings
+DIRECTORY_LABEL_STYLE = f"""
+    color: {COLORS['text_secondary']};
+    font-size: 13px;
+    background: transparent;
+    border: none;
+"""
+
 # Estilo para label de status
 STATUS_LABEL_STYLE = """
     color: #4A5568;
@@ -186,3 +222,57 @@ STATUS_LABEL_STYLE = """
     border: none;
     margin-left: 8px;
 """
+
+# ========== Estilos derivados de COLORS (se formatean una sola vez al importar) ==========
+
+MAIN_WINDOW_STYLE = f"QMainWindow {{ background-color: {COLORS['bg_primary']}; }}"
+
+CONTENT_AREA_STYLE = f"background-color: {COLORS['bg_primary']};"
+
+SIDEBAR_HEADER_STYLE = f"background-color: white; border-bottom: 1px solid {COLORS['border']};"
+
+SIDEBAR_AVATAR_STYLE = f"""
+    font-size: 32px;
+    background-color: {COLORS['bg_light']};
+    border-radius: 32px;
+    padding: 16px;
+"""
+
+SIDEBAR_TITLE_STYLE = f"color: {COLORS['text_primary']}; font-size: 16px; font-weight: 700; margin-top: 12px; background: transparent; border: none;"
+
+VERSION_LABEL_STYLE = f"color: {COLORS['text_light']}; font-size: 11px; padding: 20px; background: transparent; border: none;"
+
+PAGE_TITLE_STYLE = f"color: {COLORS['text_primary']}; font-size: 28px; font-weight: 700; background: transparent; border: none;"
+
+# Label de archivo cargado en Analytics
+TELEMETRY_INFO_STYLE = f"color: {COLORS['text_muted']}; font-size: 14px; background: transparent; border: none;"
+TELEMETRY_INFO_OK_STYLE = f"color: {COLORS['accent_green']}; font-size: 14px; font-weight: 500; background: transparent; border: none;"
+
+# Estado de conexión en Shared Memory
+CONNECTION_OK_STYLE = f"color: {COLORS['status_recording']}; font-size: 13px; font-weight: 600;"
+CONNECTION_OFF_STYLE = f"color: {COLORS['status_offline']}; font-size: 13px; font-weight: 600;"
+
+# Hoja única de la pestaña Settings: los hijos se seleccionan por su propiedad "role"
+SETTINGS_TAB_STYLE = f"""
+    QFrame[role="panel"] {{
+        background-color: white;
+        border: 1px solid #E2E8F0;
+        border-radius: 12px;
+    }}
+    QLabel[role="title"] {{{PANEL_TITLE_STYLE}}}
+    QLabel[role="setting"] {{{SETTING_LABEL_STYLE}}}
+    QLabel[role="hint"] {{{HINT_LABEL_STYLE}}}
+    QLabel[role="directory"] {{{DIRECTORY_LABEL_STYLE}}}
+""" + COMBO_BOX_STYLE
+
+# Tabla campo/valor de la pestaña Shared Memory
+FIELD_TABLE_STYLE = f"""
+    QTableView {{
+        background: transparent;
+        border: none;
+        color: {COLORS['text_primary']};
+        font-size: 12px;
+        font-family: 'Consolas', 'Monaco', monospace;
+        selection-background-color: transparent;
+    }}
+"""
@@ -2,10 +2,27 @@
 Tabs package
 """
 
-from gui.tabs.control_tab import ControlTab
-from gui.tabs.sessions_tab import SessionsTab
-from gui.tabs.analytics_tab import AnalyticsTab
-from gui.tabs.settings_tab import SettingsTab
-from gui.tabs.shared_memory_tab import SharedMemoryTab
+import importlib
 
-__all__ = ['ControlTab', 'SessionsTab', 'AnalyticsTab', 'SettingsTab', 'SharedMemoryTab']
+# Las pestañas se importan bajo demanda (PEP 562) para no cargar sus
+# dependencias (QtCharts, json, webbrowser...) hasta que se visitan
+_TAB_MODULES = {
+    'ControlTab': 'control_tab',
+    'SessionsTab': 'sessions_tab',
+    'AnalyticsTab': 'analytics_tab',
+    'SettingsTab': 'settings_tab',
+    'SharedMemoryTab': 'shared_memory_tab',
+    'TelemetryAnalysisTab': 'telemetry_analysis_tab',
+}
+
+__all__ = list(_TAB_MODULES)
+
+
+def __getattr__(name: str):
+    module_name = _TAB_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    tab_class = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = tab_class
+    return tab_class
@@ -3,14 +3,21 @@ Pestaña de Analytics - Visualización de telemetría
 """
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                               QFrame, QTextEdit, QFileDialog, QMessageBox)
+                               QFrame, QPlainTextEdit, QFileDialog, QMessageBox)
 from PySide6.QtCore import Signal
 from pathlib import Path
-import json
+from array import array
+from datetime import datetime
 import webbrowser
 
+from core.telemetry_recorder import TelemetryRecorder
 from gui.widgets import ModernButton
-from gui.styles import COLORS, PANEL_STYLE, PANEL_TITLE_STYLE, TEXT_EDIT_STYLE
+from gui.styles import (PANEL_STYLE, PANEL_TITLE_STYLE, TEXT_EDIT_STYLE,
+                        TELEMETRY_INFO_STYLE, TELEMETRY_INFO_OK_STYLE)
+
+
+# Visualizador web incluido en la raíz del proyecto
+VIEWER_PATH = Path(__file__).resolve().parents[2] / "telemetry_viewer.html"
 
 
 class AnalyticsTab(QWidget):
@@ -45,7 +52,7 @@ class AnalyticsTab(QWidget):
         
         # Info
         self.telemetry_info = QLabel("No telemetry loaded")
-        self.telemetry_info.setStyleSheet("color: #718096; font-size: 14px; background: transparent; border: none;")
+        self.telemetry_info.setStyleSheet(TELEMETRY_INFO_STYLE)
         layout.addWidget(self.telemetry_info)
         
         # Stats panel
@@ -66,8 +73,9 @@ class AnalyticsTab(QWidget):
         title = QLabel("Quick Stats")
         title.setStyleSheet(PANEL_TITLE_STYLE)
         
-        self.stats_text = QTextEdit()
+        self.stats_text = QPlainTextEdit()
         self.stats_text.setReadOnly(True)
+        self.stats_text.setUndoRedoEnabled(False)
         self.stats_text.setStyleSheet(TEXT_EDIT_STYLE)
         
         layout.addWidget(title)
@@ -82,7 +90,7 @@ class AnalyticsTab(QWidget):
             self,
             "Select telemetry file",
             str(self.output_dir),
-            "JSON files (*.json);;All files (*.*)"
+            "Telemetry files (*.json *.bin);;JSON files (*.json);;Binary files (*.bin);;All files (*.*)"
         )
         
         if filename:
@@ -91,44 +99,85 @@ class AnalyticsTab(QWidget):
     def load_file(self, filepath: Path):
         """Carga y analiza un archivo de telemetría"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if filepath.suffix == '.bin':
+                # Formato binario: leer solo timestamp y velocidad, sin crear dicts
+                samples = TelemetryRecorder.load_binary_speeds(filepath)
+                record_count = len(samples)
+                duration = int(samples[-1][0] - samples[0][0]) if samples else 0
+                speeds = (speed for _, speed in samples)
+            else:
+                # JSON: recorrer los registros en streaming guardando solo las velocidades
+                record_count = 0
+                first_timestamp = last_timestamp = None
+                speeds = array('d')
+                for record in TelemetryRecorder.iter_json_records(filepath):
+                    record_count += 1
+                    timestamp = record.get('timestamp')
+                    if timestamp:
+                        if first_timestamp is None:
+                            first_timestamp = timestamp
+                        last_timestamp = timestamp
+                    player = record.get('player_telemetry')
+                    if player and 'speed_kmh' in player:
+                        speeds.append(player['speed_kmh'])
+                
+                # Duración entre el primer y el último timestamp, como en el formato binario
+                duration = 0
+                if first_timestamp is not None:
+                    elapsed = datetime.fromisoformat(last_timestamp) - datetime.fromisoformat(first_timestamp)
+                    duration = int(elapsed.total_seconds())
             
-            self.telemetry_info.setText(f"✓ Loaded: {filepath.name} ({len(data)} records)")
-            self.telemetry_info.setStyleSheet(f"color: {COLORS['accent_green']}; font-size: 14px; font-weight: 500; background: transparent; border: none;")
+            self.telemetry_info.setText(f"✓ Loaded: {filepath.name} ({record_count} records)")
+            self.telemetry_info.setStyleSheet(TELEMETRY_INFO_OK_STYLE)
             
-            self.generate_stats(data)
+            self.generate_stats(record_count, duration, speeds)
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not load file:\n{str(e)}")
     
-    def generate_stats(self, data: list):
-        """Genera estadísticas básicas"""
-        stats = "=" * 70 + "\n"
-        stats += "TELEMETRY STATISTICS\n"
-        stats += "=" * 70 + "\n\n"
-        stats += f"📊 Total records: {len(data)}\n"
-        
-        if data:
-            duration = data[-1]['second']
-            stats += f"⏱️  Duration: {duration // 60:02d}:{duration % 60:02d}\n\n"
+    def generate_stats(self, record_count: int, duration: int, speeds):
+        """
+        Genera estadísticas básicas
+        
+        Args:
+            record_count: Número de registros cargados
+            duration: Duración de la grabación en segundos
+            speeds: Iterable con la velocidad (km/h) de cada registro
+        """
+        parts = [
+            "=" * 70 + "\n",
+            "TELEMETRY STATISTICS\n",
+            "=" * 70 + "\n\n",
+            f"📊 Total records: {record_count}\n",
+        ]
+        
+        if record_count:
+            parts.append(f"⏱️  Duration: {duration // 60:02d}:{duration % 60:02d}\n\n")
+            
+            # Speed analysis (una sola pasada: máximo, suma y cuenta)
+            max_speed = float('-inf')
+            total_speed = 0.0
+            count = 0
+            for speed in speeds:
+                if speed > max_speed:
+                    max_speed = speed
+                total_speed += speed
+                count += 1
             
-            # Speed analysis
-            speeds = [r['player_telemetry']['speed_kmh'] for r in data 
-                     if r.get('player_telemetry') and 'speed_kmh' in r['player_telemetry']]
-            if speeds:
-                stats += f"🏎️  Max speed: {max(speeds):.1f} km/h\n"
-                stats += f"📈 Avg speed: {sum(speeds)/len(speeds):.1f} km/h\n"
+            if count:
+                parts.append(f"🏎️  Max speed: {max_speed:.1f} km/h\n")
+                parts.append(f"📈 Avg speed: {total_speed/count:.1f} km/h\n")
         
-        stats += "\n" + "=" * 70 + "\n"
-        stats += "💡 Use 'Web Viewer' for detailed charts\n"
+        parts.append("\n" + "=" * 70 + "\n")
+        parts.append("💡 Use 'Web Viewer' for detailed charts\n")
         
-        self.stats_text.setPlainText(stats)
+        self.stats_text.setUpdatesEnabled(False)
+        self.stats_text.setPlainText("".join(parts))
+        self.stats_text.setUpdatesEnabled(True)
     
     def open_web_viewer(self):
         """Abre el visualizador web"""
-        viewer_path = Path(__file__).parent.parent.parent / "telemetry_viewer.html"
-        if viewer_path.exists():
-            webbrowser.open(viewer_path.as_uri())
+        if VIEWER_PATH.exists():
+            webbrowser.open(VIEWER_PATH.as_uri())
         else:
             QMessageBox.critical(self, "Error", "Web viewer not found")
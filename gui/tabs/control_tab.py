@@ -1,10 +1,15 @@
 """
 Pestaña de Control - Monitoreo y grabación
+
+La ventana principal crea una única instancia y la reutiliza durante toda la
+sesión; para volver al estado inicial se usa clear_log() en lugar de reconstruirla.
 """
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QTextEdit
-from PySide6.QtCore import Signal
-from datetime import datetime
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QPlainTextEdit
+from PySide6.QtCore import Qt, QTimer, Signal
+from collections import deque
+from typing import Optional
+import time
 
 from gui.widgets import ModernButton, StatusIndicator, DataCard
 from gui.styles import COLORS, PANEL_STYLE, PANEL_TITLE_STYLE, TEXT_EDIT_STYLE, STATUS_LABEL_STYLE
@@ -17,10 +22,46 @@ class ControlTab(QWidget):
     start_monitoring_requested = Signal()
     stop_monitoring_requested = Signal()
     
+    # Avisa (encolado si viene de otro thread) de que hay mensajes pendientes
+    _log_pending = Signal()
+    
+    # Ventana de agrupación de mensajes pendientes al log (ms)
+    LOG_FLUSH_INTERVAL_MS = 80
+    # Líneas máximas que conserva el log (las más antiguas se descartan)
+    LOG_MAX_LINES = 5000
+    
+    # Instancias creadas: la pestaña se construye una sola vez y se reutiliza
+    _instance_count = 0
+    # Intervalo mínimo entre repintados de las cards de datos (~60 Hz)
+    CARDS_FLUSH_INTERVAL_MS = 16
+    
     def __init__(self):
         super().__init__()
+        type(self)._instance_count += 1
+        assert type(self)._instance_count == 1, "ControlTab debe reutilizarse, no reconstruirse"
         self.setup_ui()
         
+        # Cola de mensajes pendientes: log() puede llamarse desde cualquier
+        # thread (deque.append es atómico); un timer de un solo disparo, armado
+        # con el primer mensaje, la vacía en el hilo de la GUI. Acotada al
+        # tamaño del log: si no se vacía, descarta sola los más antiguos
+        self._log_queue = deque(maxlen=self.LOG_MAX_LINES)
+        self._log_stamp = (-1, "")  # (segundo epoch, prefijo "[HH:MM:SS]  " ya formateado)
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setTimerType(Qt.CoarseTimer)
+        self._log_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_pending.connect(self._arm_log_timer)
+        
+        # Valores pendientes de las cards: se aplican como mucho una vez por intervalo
+        self._pending_duration: Optional[str] = None
+        self._pending_records: Optional[str] = None
+        self._cards_timer = QTimer(self)
+        self._cards_timer.setSingleShot(True)
+        self._cards_timer.setInterval(self.CARDS_FLUSH_INTERVAL_MS)
+        self._cards_timer.timeout.connect(self._flush_cards)
+        
     def setup_ui(self):
         """Configura la interfaz"""
         layout = QVBoxLayout()
@@ -129,8 +170,11 @@ class ControlTab(QWidget):
         title = QLabel("Event Log")
         title.setStyleSheet(PANEL_TITLE_STYLE)
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(self.LOG_MAX_LINES)
+        self.log_text.setUndoRedoEnabled(False)
+        self.log_text.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.log_text.setStyleSheet(TEXT_EDIT_STYLE)
         
         layout.addWidget(title)
@@ -152,17 +196,74 @@ class ControlTab(QWidget):
         self.status_indicator.set_color(color)
         
     def log(self, message: str):
-        """Añade un mensaje al log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.append(f"[{timestamp}]  {message}")
+        """Encola un mensaje para el log (seguro desde cualquier thread)"""
+        # El prefijo solo se reformatea cuando cambia el segundo
+        now = int(time.time())
+        second, prefix = self._log_stamp
+        if now != second:
+            prefix = time.strftime("[%H:%M:%S]  ", time.localtime(now))
+            self._log_stamp = (now, prefix)
+        
+        self._log_queue.append(prefix + message)
+        # Siempre se avisa: comprobar antes si la cola estaba vacía compite con
+        # _flush_log y podía dejar mensajes en cola sin timer armado
+        self._log_pending.emit()
+    
+    def showEvent(self, event):
+        """Vuelca los mensajes acumulados mientras la pestaña estaba oculta"""
+        super().showEvent(event)
+        self._flush_log()
+    
+    def _arm_log_timer(self):
+        """Arranca el volcado diferido si no hay uno en curso"""
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    def _flush_log(self):
+        """Vuelca de una vez los mensajes pendientes al widget de log"""
+        # Con la pestaña oculta no se toca el widget; showEvent vacía la cola
+        if not self._log_queue or not self.log_text.isVisible():
+            return
+        
+        lines = []
+        while self._log_queue:
+            lines.append(self._log_queue.popleft())
+        self.log_text.appendPlainText("\n".join(lines))
         
     def update_duration(self, duration_text: str):
         """Actualiza la duración mostrada"""
-        self.card_duration.set_value(duration_text)
+        self._pending_duration = duration_text
+        self._arm_cards_timer()
         
     def update_records(self, count: int):
         """Actualiza el contador de registros"""
-        self.card_records.set_value(str(count))
+        self._pending_records = str(count)
+        self._arm_cards_timer()
+    
+    def _arm_cards_timer(self):
+        """Programa el volcado de las cards si no hay uno en curso"""
+        if not self._cards_timer.isActive():
+            self._cards_timer.start()
+    
+    def _flush_cards(self):
+        """Aplica a las cards los últimos valores recibidos"""
+        if self._pending_duration is not None:
+            self.card_duration.set_value(self._pending_duration)
+            self._pending_duration = None
+        if self._pending_records is not None:
+            self.card_records.set_value(self._pending_records)
+            self._pending_records = None
+        
+    def clear_log(self):
+        """Vacía el log y devuelve las cards a sus valores iniciales"""
+        self._log_queue.clear()
+        self.log_text.clear()
+        self._pending_duration = None
+        self._pending_records = None
+        self._cards_timer.stop()
+        self.card_duration.set_value("00:00:00")
+        self.card_records.set_value("0")
+        self.card_session.set_value("—")
         
     def update_session_name(self, name: str):
         """Actualiza el nombre de sesión"""
@@ -3,28 +3,267 @@ Pestaña de Sessions - Grabaciones guardadas
 """
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFrame, 
-                               QTreeWidget, QTreeWidgetItem, QHeaderView, QMessageBox)
-from PySide6.QtCore import Qt, Signal
+                               QTreeView, QHeaderView, QMessageBox)
+from PySide6.QtCore import (Qt, Signal, QObject, QRunnable, QThreadPool, QFileSystemWatcher,
+                            QAbstractTableModel, QModelIndex)
 from pathlib import Path
 from datetime import datetime
-import json
+from typing import Callable, List, Optional, Tuple
 import subprocess
 import os
 import platform
+import json
+import re
 
 from gui.widgets import ModernButton
 from gui.styles import PANEL_STYLE, TREE_WIDGET_STYLE
 
 
+# Bytes leídos al principio/final de telemetry.json para estimar la duración;
+# la ventana se duplica hasta el máximo si no contiene ningún registro completo
+# (con clasificación, un registro ocupa varios KiB)
+_JSON_PEEK_BYTES = 4096
+_JSON_PEEK_MAX_BYTES = 4 * 1024 * 1024
+
+# Patrones para localizar 'second' y 'timestamp' sin decodificar el JSON
+_LAST_SECOND_RE = re.compile(rb'"second"\s*:\s*(\d+)')
+_TIMESTAMP_RE = re.compile(rb'"timestamp"\s*:\s*"([^"]+)"')
+
+
+def _read_summary_duration(summary_file: str) -> Optional[int]:
+    """
+    Obtiene la duración (segundos) del summary.json que se escribe al detener la grabación
+    
+    Returns:
+        Duración en segundos o None si el resumen no es válido
+    """
+    try:
+        with open(summary_file, 'rb') as f:
+            return int(json.loads(f.read())['duration_seconds'])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _format_seconds(seconds: int) -> str:
+    """Formatea una duración en segundos como MM:SS"""
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+def _read_telemetry_duration(json_file: Path) -> Optional[int]:
+    """
+    Obtiene la duración (segundos) de un telemetry.json leyendo solo sus extremos
+    
+    Usa el campo 'second' del último registro si existe; si no, la diferencia
+    entre el primer y el último 'timestamp'. La ventana leída del final crece
+    hacia atrás hasta encontrar un 'timestamp' (o llegar a _JSON_PEEK_MAX_BYTES).
+    
+    Returns:
+        Duración en segundos o None si no se pudo determinar
+    """
+    with open(json_file, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        limit = min(size, _JSON_PEEK_MAX_BYTES)
+        window = _JSON_PEEK_BYTES
+        while True:
+            f.seek(max(0, size - window))
+            tail = f.read()
+            
+            seconds = _LAST_SECOND_RE.findall(tail)
+            if seconds:
+                return int(seconds[-1])
+            
+            last = _TIMESTAMP_RE.findall(tail)
+            if last or window >= limit:
+                break
+            window *= 2
+        
+        if not last:
+            return None
+        
+        # El primer registro ocupa lo mismo que el último: basta la misma ventana
+        f.seek(0)
+        first = _TIMESTAMP_RE.search(f.read(window))
+        if not first:
+            return None
+    
+    start = datetime.fromisoformat(first.group(1).decode())
+    end = datetime.fromisoformat(last[-1].decode())
+    return int((end - start).total_seconds())
+
+
+def _format_telemetry_duration(json_file: Path) -> str:
+    """Duración formateada de un telemetry.json, o "—" si no se pudo determinar"""
+    try:
+        seconds = _read_telemetry_duration(json_file)
+    except (OSError, ValueError):
+        return "—"
+    return _format_seconds(seconds) if seconds is not None else "—"
+
+
+# Fila de la lista: (sesión, fecha, duración, tamaño, ruta de la sesión,
+#                   ruta de telemetry.json o "", mtime de telemetry.json)
+RecordingRow = Tuple[str, str, str, str, str, str, float]
+
+# Texto de duración mientras se lee en segundo plano
+_PENDING_DURATION = "…"
+
+
+class _ScanSignals(QObject):
+    """Señales del escaneo de grabaciones en segundo plano"""
+    
+    finished = Signal(int, list)  # (generación, filas)
+
+
+class _RecordingsScanner(QRunnable):
+    """Ejecuta el escaneo de grabaciones en el QThreadPool, fuera del hilo de la GUI"""
+    
+    def __init__(self, scan: Callable[[], List[RecordingRow]], generation: int):
+        super().__init__()
+        self.scan = scan
+        self.generation = generation
+        self.signals = _ScanSignals()
+    
+    def run(self):
+        try:
+            rows = self.scan()
+        except OSError as e:
+            print(f"Error escaneando grabaciones: {e}")
+            rows = []
+        self.signals.finished.emit(self.generation, rows)
+
+
+class _DurationSignals(QObject):
+    """Señales de la lectura de duraciones en segundo plano"""
+    
+    finished = Signal(str, float, str)  # (ruta de telemetry.json, mtime, duración)
+
+
+class _DurationReader(QRunnable):
+    """Lee la duración de un telemetry.json en el QThreadPool, fuera del hilo de la GUI"""
+    
+    def __init__(self, json_path: str, mtime: float, signals: _DurationSignals):
+        super().__init__()
+        self.json_path = json_path
+        self.mtime = mtime
+        self.signals = signals
+    
+    def run(self):
+        duration = _format_telemetry_duration(Path(self.json_path))
+        self.signals.finished.emit(self.json_path, self.mtime, duration)
+
+
+class SessionsModel(QAbstractTableModel):
+    """
+    Modelo de la lista de grabaciones sobre una lista de tuplas RecordingRow
+    
+    La duración pendiente se solicita al pedirla la vista, es decir, solo para
+    las filas que llegan a pintarse; el valor llega después con set_duration.
+    """
+    
+    HEADERS = ('Session', 'Date', 'Duration', 'Size')
+    
+    def __init__(self, duration_requester: Callable[[str, float], None], parent=None):
+        super().__init__(parent)
+        self._rows: List[RecordingRow] = []
+        self._duration_requester = duration_requester
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            column = index.column()
+            if column == 2 and row[2] == _PENDING_DURATION:
+                self._duration_requester(row[5], row[6])
+            return row[column]
+        if role == Qt.UserRole:
+            return row[4]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def set_rows(self, rows: List[RecordingRow]):
+        """Sustituye todas las filas con un único reset del modelo"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+    
+    def find_row(self, session_path: str) -> int:
+        """Índice de la fila de una sesión, o -1 si no está"""
+        for i, row in enumerate(self._rows):
+            if row[4] == session_path:
+                return i
+        return -1
+    
+    def insert_row(self, index: int, row: RecordingRow):
+        self.beginInsertRows(QModelIndex(), index, index)
+        self._rows.insert(index, row)
+        self.endInsertRows()
+    
+    def replace_row(self, index: int, row: RecordingRow):
+        self._rows[index] = row
+        self.dataChanged.emit(self.index(index, 0), self.index(index, len(self.HEADERS) - 1))
+    
+    def set_duration(self, json_path: str, mtime: float, duration: str):
+        """Sustituye la duración pendiente de las filas de ese telemetry.json"""
+        for i, row in enumerate(self._rows):
+            if row[5] == json_path and row[6] == mtime and row[2] == _PENDING_DURATION:
+                self._rows[i] = row[:2] + (duration,) + row[3:]
+                index = self.index(i, 2)
+                self.dataChanged.emit(index, index, [Qt.DisplayRole])
+    
+    def remove_row(self, index: int):
+        self.beginRemoveRows(QModelIndex(), index, index)
+        del self._rows[index]
+        self.endRemoveRows()
+    
+    def session_path(self, index: QModelIndex) -> Optional[str]:
+        """Ruta de la sesión de la fila indicada"""
+        if not index.isValid():
+            return None
+        return self._rows[index.row()][4]
+
+
 class SessionsTab(QWidget):
     """Pestaña de sesiones grabadas"""
     
     # Señal para cambiar a la pestaña de analytics
     switch_to_analytics = Signal(object)  # Path del archivo JSON
     
+    # Columnas Date y Size: se ajustan a su contenido
+    _AUTO_SIZED_COLUMNS = (1, 3)
+    # Duration tiene ancho fijo: ajustarla al contenido haría que la vista
+    # pidiera la duración de todas las filas, no solo de las visibles
+    _DURATION_COLUMN_WIDTH = 90
+    
     def __init__(self, output_dir: Path):
         super().__init__()
         self.output_dir = output_dir
+        self._duration_cache = {}  # ruta -> (mtime, texto de duración)
+        self._duration_jobs = {}  # ruta de telemetry.json -> _DurationReader en curso
+        self._duration_signals = _DurationSignals(self)
+        self._duration_signals.finished.connect(self._on_duration_read, Qt.QueuedConnection)
+        self._scan_generation = 0
+        self._scanner: Optional[_RecordingsScanner] = None
+        self._did_initial_refresh = False  # El primer escaneo espera a que se muestre la pestaña
+        
+        # Vigilar la carpeta de grabaciones y cada sesión para actualizar solo lo que cambia
+        self._watcher = QFileSystemWatcher(self)
+        self._watched_sessions = set()
+        if self.output_dir.exists():
+            self._watcher.addPath(str(self.output_dir))
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -74,10 +313,13 @@ class SessionsTab(QWidget):
         layout.addLayout(action_frame)
         
         self.setLayout(layout)
-        
-        # Cargar grabaciones iniciales
-        self.refresh_recordings()
-        
+    
+    def showEvent(self, event):
+        """Carga las grabaciones la primera vez que se muestra la pestaña"""
+        super().showEvent(event)
+        if not self._did_initial_refresh:
+            self.refresh_recordings()
+    
     def create_recordings_list(self) -> QFrame:
         """Crea el panel con la lista de grabaciones"""
         panel = QFrame()
@@ -86,17 +328,21 @@ class SessionsTab(QWidget):
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
         
-        # TreeWidget
-        self.recordings_tree = QTreeWidget()
-        self.recordings_tree.setHeaderLabels(['Session', 'Date', 'Duration', 'Size'])
+        # Vista sobre un modelo ligero (sin un QTreeWidgetItem por fila)
+        self._model = SessionsModel(self._request_duration, self)
+        self.recordings_tree = QTreeView()
+        self.recordings_tree.setModel(self._model)
+        self.recordings_tree.setRootIsDecorated(False)
+        self.recordings_tree.setUniformRowHeights(True)
         self.recordings_tree.setStyleSheet(TREE_WIDGET_STYLE)
         
         # Configurar columnas
         header = self.recordings_tree.header()
         header.setSectionResizeMode(0, QHeaderView.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
+        for column in self._AUTO_SIZED_COLUMNS:
+            header.setSectionResizeMode(column, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.Interactive)
+        header.resizeSection(2, self._DURATION_COLUMN_WIDTH)
         
         layout.addWidget(self.recordings_tree)
         panel.setLayout(layout)
@@ -105,91 +351,196 @@ class SessionsTab(QWidget):
     # ========== Métodos de acción ==========
     
     def refresh_recordings(self):
-        """Actualiza la lista de grabaciones"""
-        self.recordings_tree.clear()
-        
+        """Lanza el escaneo de grabaciones en segundo plano; la lista se rellena al terminar"""
+        self._did_initial_refresh = True
+        self._scan_generation += 1
+        self._scanner = _RecordingsScanner(self._scan_recordings, self._scan_generation)
+        self._scanner.signals.finished.connect(self._on_scan_finished, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(self._scanner)
+    
+    def _on_scan_finished(self, generation: int, rows: list):
+        """Rellena la lista con el resultado del escaneo más reciente"""
+        if generation != self._scan_generation:
+            return  # Resultado de un refresco ya superado
+        
+        self._scanner = None
+        self._model.set_rows(rows)
+        self._sync_watched_sessions()
+    
+    def _on_directory_changed(self, path: str):
+        """Actualiza solo la parte de la lista afectada por un cambio en disco"""
+        if Path(path) == self.output_dir:
+            self._sync_watched_sessions()
+        else:
+            self._update_session_row(path)
+    
+    def _sync_watched_sessions(self):
+        """Ajusta las sesiones vigiladas a las carpetas existentes, añadiendo o quitando filas"""
         if not self.output_dir.exists():
             return
         
-        sessions = sorted(
-            [d for d in self.output_dir.iterdir() if d.is_dir()],
-            key=lambda x: x.stat().st_mtime,
-            reverse=True
+        with os.scandir(self.output_dir) as it:
+            current = {e.path for e in it if e.is_dir(follow_symlinks=False)}
+        
+        for path in current - self._watched_sessions:
+            self._watcher.addPath(path)
+            if self._model.find_row(path) < 0:
+                self._update_session_row(path)
+        
+        for path in self._watched_sessions - current:
+            self._watcher.removePath(path)
+            self._update_session_row(path)
+        
+        self._watched_sessions = current
+    
+    def _update_session_row(self, session_path: str):
+        """Inserta, actualiza o elimina la fila de una única sesión"""
+        try:
+            row = self._scan_session(session_path)
+        except OSError:
+            row = None  # La carpeta ya no existe
+        
+        index = self._model.find_row(session_path)
+        if row is None:
+            if index >= 0:
+                self._model.remove_row(index)
+        elif index >= 0:
+            self._model.replace_row(index, row)
+        else:
+            # Las sesiones nuevas son las más recientes: van arriba
+            self._model.insert_row(0, row)
+    
+    def _scan_recordings(self) -> List[RecordingRow]:
+        """
+        Recorre el directorio de grabaciones (se ejecuta en un thread del pool)
+        
+        Returns:
+            Filas para la lista, de la sesión más reciente a la más antigua
+        """
+        rows = []
+        
+        if not self.output_dir.exists():
+            return rows
+        
+        # Un scandir por directorio: los DirEntry traen el tipo y cachean stat()
+        with os.scandir(self.output_dir) as it:
+            sessions = [e for e in it if e.is_dir(follow_symlinks=False)]
+        sessions.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+        
+        for session in sessions:
+            row = self._scan_session(session.path)
+            if row is not None:
+                rows.append(row)
+        
+        return rows
+    
+    def _scan_session(self, session_path: str) -> Optional[RecordingRow]:
+        """
+        Construye la fila de una carpeta de sesión
+        
+        Returns:
+            Fila para la lista, o None si la sesión aún no tiene vídeo
+        """
+        with os.scandir(session_path) as it:
+            files = {e.name: e for e in it}
+        
+        video_entry = files.get("race_recording.mp4")
+        if video_entry is None:
+            return None
+        
+        stat = video_entry.stat()
+        date = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M")
+        size_mb = stat.st_size / (1024 * 1024)
+        
+        # La duración sale del summary.json; en sesiones antiguas sin resumen
+        # se lee del telemetry.json en segundo plano al mostrarse la fila, salvo que esté en caché
+        duration = "—"
+        json_path = ""
+        json_mtime = 0.0
+        json_entry = files.get("telemetry.json")
+        summary_entry = files.get("summary.json")
+        summary_seconds = _read_summary_duration(summary_entry.path) if summary_entry else None
+        if json_entry is not None:
+            json_path = json_entry.path
+            json_mtime = json_entry.stat().st_mtime
+            cached = self._duration_cache.get(json_path)
+            duration = cached[1] if cached and cached[0] == json_mtime else _PENDING_DURATION
+        if summary_seconds is not None:
+            duration = _format_seconds(summary_seconds)
+        
+        return (
+            os.path.basename(session_path),
+            date,
+            duration,
+            f"{size_mb:.1f} MB",
+            session_path,
+            json_path,
+            json_mtime
         )
         
-        for session_dir in sessions:
-            video_file = session_dir / "race_recording.mp4"
-            json_file = session_dir / "telemetry.json"
-            
-            if video_file.exists():
-                stat = video_file.stat()
-                date = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M")
-                size_mb = stat.st_size / (1024 * 1024)
-                
-                # Calcular duración del JSON
-                duration = "—"
-                if json_file.exists():
-                    try:
-                        with open(json_file, 'r') as f:
-                            data = json.load(f)
-                            if data:
-                                seconds = data[-1]['second']
-                                mins = seconds // 60
-                                secs = seconds % 60
-                                duration = f"{mins:02d}:{secs:02d}"
-                    except:
-                        pass
-                
-                item = QTreeWidgetItem([
-                    session_dir.name,
-                    date,
-                    duration,
-                    f"{size_mb:.1f} MB"
-                ])
-                item.setData(0, Qt.UserRole, str(session_dir))
-                self.recordings_tree.addTopLevelItem(item)
+    def _request_duration(self, json_path: str, mtime: float):
+        """Lanza en el QThreadPool la lectura de la duración de un telemetry.json"""
+        if json_path in self._duration_jobs:
+            return  # Ya se está leyendo
         
-    def open_recordings_folder(self):
-        """Abre la carpeta de grabaciones"""
+        cached = self._duration_cache.get(json_path)
+        if cached and cached[0] == mtime:
+            # Se llama desde data(): la fila se actualiza fuera del pintado
+            self._duration_signals.finished.emit(json_path, mtime, cached[1])
+            return
+        
+        job = _DurationReader(json_path, mtime, self._duration_signals)
+        self._duration_jobs[json_path] = job
+        QThreadPool.globalInstance().start(job)
+    
+    def _on_duration_read(self, json_path: str, mtime: float, duration: str):
+        """Guarda en caché la duración leída y la muestra en su fila"""
+        self._duration_jobs.pop(json_path, None)
+        self._duration_cache[json_path] = (mtime, duration)
+        self._model.set_duration(json_path, mtime, duration)
+        
+    @staticmethod
+    def _open_path(path: Path):
+        """Abre un archivo o carpeta con la aplicación del sistema sin esperar a que termine"""
         system = platform.system()
         
         if system == "Windows":
-            os.startfile(self.output_dir)
-        elif system == "Darwin":  # macOS
-            subprocess.run(['open', str(self.output_dir)])
-        else:  # Linux
-            subprocess.run(['xdg-open', str(self.output_dir)])
+            os.startfile(path)
+            return
+        
+        command = 'open' if system == "Darwin" else 'xdg-open'  # macOS / Linux
+        subprocess.Popen([command, str(path)],
+                         stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL,
+                         start_new_session=True)
+    
+    def open_recordings_folder(self):
+        """Abre la carpeta de grabaciones"""
+        self._open_path(self.output_dir)
         
     def play_selected_video(self):
         """Reproduce el video seleccionado"""
-        current_item = self.recordings_tree.currentItem()
-        if not current_item:
+        selected = self._model.session_path(self.recordings_tree.currentIndex())
+        if not selected:
             QMessageBox.warning(self, "Warning", "Please select a recording first")
             return
         
-        session_path = Path(current_item.data(0, Qt.UserRole))
+        session_path = Path(selected)
         video_file = session_path / "race_recording.mp4"
         
         if video_file.exists():
-            system = platform.system()
-            
-            if system == "Windows":
-                os.startfile(video_file)
-            elif system == "Darwin":
-                subprocess.run(['open', str(video_file)])
-            else:
-                subprocess.run(['xdg-open', str(video_file)])
+            self._open_path(video_file)
         else:
             QMessageBox.critical(self, "Error", "Video file not found")
         
     def view_selected_telemetry(self):
         """Visualiza la telemetría seleccionada"""
-        current_item = self.recordings_tree.currentItem()
-        if not current_item:
+        selected = self._model.session_path(self.recordings_tree.currentIndex())
+        if not selected:
             QMessageBox.warning(self, "Warning", "Please select a recording first")
             return
         
-        session_path = Path(current_item.data(0, Qt.UserRole))
+        session_path = Path(selected)
         json_file = session_path / "telemetry.json"
         
         if json_file.exists():
@@ -200,17 +551,9 @@ class SessionsTab(QWidget):
         
     def open_selected_folder(self):
         """Abre la carpeta de la sesión seleccionada"""
-        current_item = self.recordings_tree.currentItem()
-        if not current_item:
+        selected = self._model.session_path(self.recordings_tree.currentIndex())
+        if not selected:
             QMessageBox.warning(self, "Warning", "Please select a recording first")
             return
         
-        session_path = Path(current_item.data(0, Qt.UserRole))
-        system = platform.system()
-        
-        if system == "Windows":
-            os.startfile(session_path)
-        elif system == "Darwin":
-            subprocess.run(['open', str(session_path)])
-        else:
-            subprocess.run(['xdg-open', str(session_path)])
+        self._open_path(Path(selected))
@@ -1,15 +1,82 @@
 """
 Pestaña de Settings - Configuración
+
+La ventana principal crea la pestaña una sola vez (al visitarla) y la reutiliza.
 """
 
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel, 
                                QFrame, QComboBox, QFileDialog, QMessageBox)
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Qt, QTimer, Signal
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
+from typing import Optional, Tuple
 import json
+import os
 
 from gui.widgets import ModernButton
-from gui.styles import COLORS, PANEL_STYLE, PANEL_TITLE_STYLE, COMBO_BOX_STYLE, SETTING_LABEL_STYLE, HINT_LABEL_STYLE
+from gui.styles import SETTINGS_TAB_STYLE
+
+
+# config.json en la raíz del proyecto (la ruta no cambia durante la ejecución)
+_CONFIG_FILE = Path(__file__).resolve().parents[2] / "config.json"
+
+# Opción del combo de codec -> valor de hw_accel (en el orden en que se muestran)
+_CODEC_MAP = MappingProxyType({
+    'Auto (Detect GPU)': None,
+    'NVIDIA NVENC (h264_nvenc)': 'nvenc',
+    'Intel QuickSync (h264_qsv)': 'qsv',
+    'Apple VideoToolbox (macOS)': 'videotoolbox',
+    'Software (libx264)': None
+})
+
+# Opción del combo de codec para cada hw_accel guardado (la primera que coincide)
+_CODEC_LABELS = MappingProxyType({
+    hw_accel: label for label, hw_accel in reversed(list(_CODEC_MAP.items()))
+})
+
+# Primera opción del combo de audio: dejar que ScreenRecorder elija el dispositivo
+_AUTO_AUDIO_DEVICE = 'Auto (System Default)'
+
+# Opciones de los combos
+_CODEC_OPTIONS = tuple(_CODEC_MAP)
+_FPS_OPTIONS = ('24', '30', '60')
+_CRF_OPTIONS = ('18', '23', '28')
+_PRESET_OPTIONS = ('ultrafast', 'fast', 'medium')
+_INTERVAL_OPTIONS = ('0.5', '1', '2')
+
+
+def load_saved_config() -> dict:
+    """
+    Lee el config.json guardado previamente, descartando los valores no válidos
+    
+    Returns:
+        Configuración guardada (solo las claves con valores válidos), o
+        diccionario vacío si no existe o no es válida
+    """
+    try:
+        data = json.loads(_CONFIG_FILE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    
+    config = {}
+    for key, options in (('fps', _FPS_OPTIONS), ('crf', _CRF_OPTIONS),
+                         ('preset', _PRESET_OPTIONS), ('interval', _INTERVAL_OPTIONS)):
+        value = str(data.get(key))
+        if value in options:
+            config[key] = value
+    
+    hw_accel = data.get('hw_accel')
+    if 'hw_accel' in data and (hw_accel is None or isinstance(hw_accel, str)) and hw_accel in _CODEC_LABELS:
+        config['hw_accel'] = hw_accel
+    
+    for key in ('audio_device', 'output_dir'):
+        value = data.get(key)
+        if isinstance(value, str) and value:
+            config[key] = value
+    return config
 
 
 class SettingsTab(QWidget):
@@ -17,24 +84,79 @@ class SettingsTab(QWidget):
     
     # Señal cuando se guarda la configuración
     config_saved = Signal(dict)
+    # Resultado de la escritura en segundo plano: (config, mensaje de error o "")
+    _config_written = Signal(dict, str)
+    # Resultado de la búsqueda de dispositivos de audio: (dispositivos, mensaje de error o "")
+    _audio_devices_listed = Signal(list, str)
+    
+    # Un único worker serializa las escrituras de config.json fuera del hilo de la GUI
+    _config_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="config-writer")
+    # Listar dispositivos de audio lanza ffmpeg y puede tardar segundos
+    _device_lister = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio-devices")
+    
+    # Espera antes de lanzar la búsqueda de dispositivos, para agrupar clics seguidos (ms)
+    AUDIO_REFRESH_DEBOUNCE_MS = 200
+    
+    # Instancias creadas: la pestaña se construye una sola vez y se reutiliza
+    _instance_count = 0
     
     def __init__(self, output_dir: Path):
         super().__init__()
+        type(self)._instance_count += 1
+        assert type(self)._instance_count == 1, "SettingsTab debe reutilizarse, no reconstruirse"
         self.output_dir = output_dir
-        
-        # Valores por defecto
-        self.fps_var = "30"
-        self.crf_var = "23"
-        self.preset_var = "ultrafast"
-        self.interval_var = "1"
+        self._output_dir_str = str(output_dir)  # Se recalcula solo al cambiar de carpeta
+        
+        # Valores guardados en config.json, o por defecto; los combos se crean
+        # ya con el valor final
+        saved = load_saved_config()
+        self.fps_var = saved.get('fps', "30")
+        self.crf_var = saved.get('crf', "23")
+        self.preset_var = saved.get('preset', "ultrafast")
+        self.interval_var = saved.get('interval', "1")
+        self._saved_codec = _CODEC_LABELS.get(saved.get('hw_accel'))
+        self._saved_audio = saved.get('audio_device')
+        
+        # ScreenRecorder reutilizado para listar dispositivos (se crea en el worker)
+        self._recorder_for_probe = None
+        
+        # Búsqueda de dispositivos programada o en curso: los clics extra se ignoran
+        self._refresh_pending = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.AUDIO_REFRESH_DEBOUNCE_MS)
+        self._refresh_timer.timeout.connect(self._start_audio_probe)
+        
+        # Última configuración escrita con éxito (para no reescribir si no cambia)
+        self._last_saved_config = None
+        
+        self._config_written.connect(self._on_config_written)
+        self._audio_devices_listed.connect(self._on_audio_devices_listed)
         
         self.setup_ui()
         
     def setup_ui(self):
-        """Configura la interfaz"""
+        """Configura la interfaz (los paneles se construyen al mostrar la pestaña)"""
+        self._built = False
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(24)
+        self.setLayout(layout)
+        
+        # Una sola hoja para toda la pestaña en lugar de una por widget
+        self.setStyleSheet(SETTINGS_TAB_STYLE)
+    
+    def showEvent(self, event):
+        """Construye los paneles la primera vez que se muestra la pestaña"""
+        self._ensure_built()
+        super().showEvent(event)
+    
+    def _ensure_built(self):
+        """Crea los paneles de configuración si aún no existen"""
+        if self._built:
+            return
+        self._built = True
+        layout = self.layout()
         
         # Video settings
         video_panel = self.create_video_panel()
@@ -55,264 +177,278 @@ class SettingsTab(QWidget):
         
         layout.addStretch()
         
-        self.setLayout(layout)
+    @staticmethod
+    def _make_panel(title_text: str) -> Tuple[QFrame, QVBoxLayout]:
+        """
+        Crea el marco común de un panel con su título
         
-    def create_video_panel(self) -> QFrame:
-        """Panel de configuración de video"""
+        Returns:
+            (panel, layout) listo para añadir las filas del panel
+        """
         panel = QFrame()
-        panel.setStyleSheet(PANEL_STYLE)
+        panel.setProperty("role", "panel")
         
-        layout = QVBoxLayout()
+        layout = QVBoxLayout(panel)
         layout.setContentsMargins(24, 20, 24, 20)
         layout.setSpacing(16)
         
-        title = QLabel("Video Recording")
-        title.setStyleSheet(PANEL_TITLE_STYLE)
+        title = QLabel(title_text)
+        title.setProperty("role", "title")
         layout.addWidget(title)
+        return panel, layout
+    
+    @staticmethod
+    def _create_form() -> QFormLayout:
+        """Layout de formulario para las filas de ajustes"""
+        form = QFormLayout()
+        form.setLabelAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        form.setFieldGrowthPolicy(QFormLayout.FieldsStayAtSizeHint)
+        form.setVerticalSpacing(16)
+        return form
+    
+    @staticmethod
+    def _make_combo(items, current: Optional[str] = None) -> QComboBox:
+        """
+        Crea un combo con sus opciones y el valor inicial ya seleccionado
+        
+        Se rellena con señales y repintado desactivados, para no emitir
+        cambios de índice intermedios.
+        """
+        combo = QComboBox()
+        combo.blockSignals(True)
+        combo.setUpdatesEnabled(False)
+        combo.addItems(items)
+        if current is not None:
+            combo.setCurrentText(str(current))
+        combo.setUpdatesEnabled(True)
+        combo.blockSignals(False)
+        return combo
+    
+    @staticmethod
+    def _setting_label(text: str) -> QLabel:
+        """Etiqueta de un ajuste (ancho mínimo común para alinear todos los paneles)"""
+        label = QLabel(text)
+        label.setProperty("role", "setting")
+        label.setMinimumWidth(120)
+        return label
+    
+    def create_video_panel(self) -> QFrame:
+        """Panel de configuración de video"""
+        panel, layout = self._make_panel("Video Recording")
+        
+        # Una fila por ajuste: etiqueta + combo
+        form = self._create_form()
         
         # Codec / Hardware Acceleration
-        codec_row = QHBoxLayout()
-        codec_label = QLabel("Codec:")
-        codec_label.setStyleSheet(SETTING_LABEL_STYLE)
-        codec_label.setMinimumWidth(120)
-        self.codec_combo = QComboBox()
-        self.codec_combo.addItems([
-            'Auto (Detect GPU)',
-            'NVIDIA NVENC (h264_nvenc)',
-            'Intel QuickSync (h264_qsv)',
-            'Apple VideoToolbox (macOS)',
-            'Software (libx264)'
-        ])
-        self.codec_combo.setCurrentIndex(0)
-        self.codec_combo.setStyleSheet(COMBO_BOX_STYLE)
-        codec_row.addWidget(codec_label)
-        codec_row.addWidget(self.codec_combo)
-        codec_row.addStretch()
-        layout.addLayout(codec_row)
+        self.codec_combo = self._make_combo(_CODEC_OPTIONS, self._saved_codec)
+        form.addRow(self._setting_label("Codec:"), self.codec_combo)
         
         # FPS
-        fps_row = QHBoxLayout()
-        fps_label = QLabel("FPS:")
-        fps_label.setStyleSheet(SETTING_LABEL_STYLE)
-        fps_label.setMinimumWidth(120)
-        self.fps_combo = QComboBox()
-        self.fps_combo.addItems(['24', '30', '60'])
-        self.fps_combo.setCurrentText(self.fps_var)
-        self.fps_combo.setStyleSheet(COMBO_BOX_STYLE)
-        fps_row.addWidget(fps_label)
-        fps_row.addWidget(self.fps_combo)
-        fps_row.addStretch()
-        layout.addLayout(fps_row)
-        
-        # CRF
-        crf_row = QHBoxLayout()
-        crf_label = QLabel("Quality (CRF):")
-        crf_label.setStyleSheet(SETTING_LABEL_STYLE)
-        crf_label.setMinimumWidth(120)
-        self.crf_combo = QComboBox()
-        self.crf_combo.addItems(['18', '23', '28'])
-        self.crf_combo.setCurrentText(self.crf_var)
-        self.crf_combo.setStyleSheet(COMBO_BOX_STYLE)
+        self.fps_combo = self._make_combo(_FPS_OPTIONS, self.fps_var)
+        form.addRow(self._setting_label("FPS:"), self.fps_combo)
+        
+        # CRF (con la leyenda de calidad junto al combo)
+        self.crf_combo = self._make_combo(_CRF_OPTIONS, self.crf_var)
         crf_hint = QLabel("(18=High, 23=Medium, 28=Low)")
-        crf_hint.setStyleSheet(HINT_LABEL_STYLE)
-        crf_row.addWidget(crf_label)
-        crf_row.addWidget(self.crf_combo)
-        crf_row.addWidget(crf_hint)
-        crf_row.addStretch()
-        layout.addLayout(crf_row)
+        crf_hint.setProperty("role", "hint")
+        crf_field = QHBoxLayout()
+        crf_field.addWidget(self.crf_combo)
+        crf_field.addWidget(crf_hint)
+        crf_field.addStretch()
+        form.addRow(self._setting_label("Quality (CRF):"), crf_field)
         
         # Preset
-        preset_row = QHBoxLayout()
-        preset_label = QLabel("Preset:")
-        preset_label.setStyleSheet(SETTING_LABEL_STYLE)
-        preset_label.setMinimumWidth(120)
-        self.preset_combo = QComboBox()
-        self.preset_combo.addItems(['ultrafast', 'fast', 'medium'])
-        self.preset_combo.setCurrentText(self.preset_var)
-        self.preset_combo.setStyleSheet(COMBO_BOX_STYLE)
-        preset_row.addWidget(preset_label)
-        preset_row.addWidget(self.preset_combo)
-        preset_row.addStretch()
-        layout.addLayout(preset_row)
+        self.preset_combo = self._make_combo(_PRESET_OPTIONS, self.preset_var)
+        form.addRow(self._setting_label("Preset:"), self.preset_combo)
         
         # Audio Device
-        audio_row = QHBoxLayout()
-        audio_label = QLabel("Audio Device:")
-        audio_label.setStyleSheet(SETTING_LABEL_STYLE)
-        audio_label.setMinimumWidth(120)
-        self.audio_combo = QComboBox()
-        self.audio_combo.addItem('Auto (System Default)')
-        self.audio_combo.setStyleSheet(COMBO_BOX_STYLE)
-        audio_row.addWidget(audio_label)
-        audio_row.addWidget(self.audio_combo)
-        audio_row.addStretch()
-        layout.addLayout(audio_row)
+        # El dispositivo guardado se ofrece aunque aún no se hayan listado los demás
+        audio_options = (_AUTO_AUDIO_DEVICE,)
+        if self._saved_audio:
+            audio_options += (self._saved_audio,)
+        self.audio_combo = self._make_combo(audio_options, self._saved_audio)
+        form.addRow(self._setting_label("Audio Device:"), self.audio_combo)
+        
+        layout.addLayout(form)
         
         # Botón para refrescar dispositivos de audio
-        refresh_btn = ModernButton("🔄  Refresh Audio Devices")
-        refresh_btn.clicked.connect(self.refresh_audio_devices)
-        layout.addWidget(refresh_btn)
+        self.refresh_audio_btn = ModernButton("🔄  Refresh Audio Devices")
+        self.refresh_audio_btn.clicked.connect(self.refresh_audio_devices)
+        layout.addWidget(self.refresh_audio_btn)
         
-        panel.setLayout(layout)
         return panel
         
     def create_telemetry_panel(self) -> QFrame:
         """Panel de configuración de telemetría"""
-        panel = QFrame()
-        panel.setStyleSheet(PANEL_STYLE)
+        panel, layout = self._make_panel("Telemetry Capture")
         
-        layout = QVBoxLayout()
-        layout.setContentsMargins(24, 20, 24, 20)
-        layout.setSpacing(16)
+        form = self._create_form()
+        self.interval_combo = self._make_combo(_INTERVAL_OPTIONS, self.interval_var)
+        form.addRow(self._setting_label("Interval (sec):"), self.interval_combo)
+        layout.addLayout(form)
         
-        title = QLabel("Telemetry Capture")
-        title.setStyleSheet(PANEL_TITLE_STYLE)
-        layout.addWidget(title)
-        
-        interval_row = QHBoxLayout()
-        interval_label = QLabel("Interval (sec):")
-        interval_label.setStyleSheet(SETTING_LABEL_STYLE)
-        interval_label.setMinimumWidth(120)
-        self.interval_combo = QComboBox()
-        self.interval_combo.addItems(['0.5', '1', '2'])
-        self.interval_combo.setCurrentText(self.interval_var)
-        self.interval_combo.setStyleSheet(COMBO_BOX_STYLE)
-        interval_row.addWidget(interval_label)
-        interval_row.addWidget(self.interval_combo)
-        interval_row.addStretch()
-        layout.addLayout(interval_row)
-        
-        panel.setLayout(layout)
         return panel
         
     def create_directory_panel(self) -> QFrame:
         """Panel de directorio de salida"""
-        panel = QFrame()
-        panel.setStyleSheet(PANEL_STYLE)
-        
-        layout = QVBoxLayout()
-        layout.setContentsMargins(24, 20, 24, 20)
-        layout.setSpacing(16)
-        
-        title = QLabel("Output Directory")
-        title.setStyleSheet(PANEL_TITLE_STYLE)
-        layout.addWidget(title)
+        panel, layout = self._make_panel("Output Directory")
         
         dir_row = QHBoxLayout()
-        self.output_dir_label = QLabel(str(self.output_dir))
-        self.output_dir_label.setStyleSheet("color: #4A5568; font-size: 13px; background: transparent; border: none;")
+        self.output_dir_label = QLabel(self._output_dir_str)
+        self.output_dir_label.setProperty("role", "directory")
         btn_change = ModernButton("Change")
         btn_change.clicked.connect(self.change_output_dir)
         dir_row.addWidget(self.output_dir_label)
         dir_row.addWidget(btn_change)
         layout.addLayout(dir_row)
         
-        panel.setLayout(layout)
         return panel
         
     def change_output_dir(self):
-        """Cambia el directorio de salida"""
-        new_dir = QFileDialog.getExistingDirectory(
-            self,
-            "Select output directory",
-            str(self.output_dir)
-        )
-        
-        if new_dir:
-            self.output_dir = Path(new_dir)
-            self.output_dir_label.setText(str(self.output_dir))
-            self.output_dir.mkdir(exist_ok=True)
+        """Abre el selector del directorio de salida (sin bloquear el bucle de eventos)"""
+        dialog = QFileDialog(self, "Select output directory", self._output_dir_str)
+        dialog.setFileMode(QFileDialog.Directory)
+        dialog.setOption(QFileDialog.ShowDirsOnly, True)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.fileSelected.connect(self._on_output_dir_chosen)
+        dialog.open()
+    
+    def _on_output_dir_chosen(self, new_dir: str):
+        """Aplica el directorio de salida elegido en el diálogo"""
+        if not new_dir:
+            return
+        
+        self.output_dir = Path(new_dir)
+        self._output_dir_str = str(self.output_dir)
+        self.output_dir_label.setText(self._output_dir_str)
+        # El diálogo en modo Directory solo acepta carpetas existentes: no hace falta mkdir
     
     def refresh_audio_devices(self):
-        """Refresca la lista de dispositivos de audio"""
-        from core.screen_recorder import ScreenRecorder
+        """Programa la búsqueda de dispositivos de audio, agrupando clics repetidos"""
+        if self._refresh_pending:
+            return
         
+        self._refresh_pending = True
+        self.refresh_audio_btn.setEnabled(False)
+        self._refresh_timer.start()
+    
+    def _start_audio_probe(self):
+        """Lanza la búsqueda de dispositivos de audio en segundo plano"""
+        self._device_lister.submit(self._list_audio_devices, self.output_dir)
+    
+    def _list_audio_devices(self, output_dir: Path):
+        """Obtiene los dispositivos de audio (se ejecuta en el worker)"""
+        devices, error = [], ""
+        try:
+            # Crear el ScreenRecorder solo la primera vez: su constructor ya consulta a ffmpeg
+            if self._recorder_for_probe is None:
+                from core.screen_recorder import ScreenRecorder
+                self._recorder_for_probe = ScreenRecorder(output_dir)
+            devices = self._recorder_for_probe.list_audio_devices(refresh=True)
+        except Exception as e:
+            error = str(e)
+        
+        self._audio_devices_listed.emit(devices, error)
+    
+    def _on_audio_devices_listed(self, devices: list, error: str):
+        """Actualiza el combo de audio con los dispositivos encontrados"""
+        self._refresh_pending = False
+        self.refresh_audio_btn.setEnabled(True)
+        if error:
+            QMessageBox.warning(self, "Warning", f"Could not refresh devices:\n{error}")
+            return
+        
+        # Actualizar combo box de una vez, sin señales ni repintados intermedios
+        current_selection = self.audio_combo.currentText()
+        self.audio_combo.blockSignals(True)
+        self.audio_combo.setUpdatesEnabled(False)
         try:
-            # Crear instancia temporal para obtener dispositivos
-            temp_recorder = ScreenRecorder(self.output_dir)
-            devices = temp_recorder.list_audio_devices()
-            
-            # Actualizar combo box
-            current_selection = self.audio_combo.currentText()
             self.audio_combo.clear()
-            self.audio_combo.addItem('Auto (System Default)')
-            
-            for device in devices:
-                self.audio_combo.addItem(device)
+            self.audio_combo.addItems([_AUTO_AUDIO_DEVICE, *devices])
             
             # Restaurar selección si existe
             index = self.audio_combo.findText(current_selection)
             if index >= 0:
                 self.audio_combo.setCurrentIndex(index)
-            
-            QMessageBox.information(self, "Success", f"Found {len(devices)} audio devices")
-        except Exception as e:
-            QMessageBox.warning(self, "Warning", f"Could not refresh devices:\n{str(e)}")
+        finally:
+            self.audio_combo.setUpdatesEnabled(True)
+            self.audio_combo.blockSignals(False)
+        
+        QMessageBox.information(self, "Success", f"Found {len(devices)} audio devices")
     
-    def save_config(self):
-        """Guarda la configuración"""
-        # Mapear codec seleccionado
-        codec_map = {
-            'Auto (Detect GPU)': None,
-            'NVIDIA NVENC (h264_nvenc)': 'nvenc',
-            'Intel QuickSync (h264_qsv)': 'qsv',
-            'Apple VideoToolbox (macOS)': 'videotoolbox',
-            'Software (libx264)': None
-        }
+    def _build_config(self, output_dir_as_str: bool = False) -> dict:
+        """
+        Construye el diccionario de configuración a partir de los widgets
         
-        selected_codec = self.codec_combo.currentText()
-        hw_accel = codec_map.get(selected_codec)
+        Args:
+            output_dir_as_str: Devolver output_dir como str (para serializar) en vez de Path
+        """
+        # Mapear codec seleccionado
+        hw_accel = _CODEC_MAP.get(self.codec_combo.currentText())
         
         # Dispositivo de audio seleccionado
-        audio_device = None
-        if self.audio_combo.currentText() != 'Auto (System Default)':
-            audio_device = self.audio_combo.currentText()
+        audio_text = self.audio_combo.currentText()
+        audio_device = None if audio_text == _AUTO_AUDIO_DEVICE else audio_text
         
-        config = {
+        return {
             'fps': self.fps_combo.currentText(),
             'crf': self.crf_combo.currentText(),
             'preset': self.preset_combo.currentText(),
             'interval': self.interval_combo.currentText(),
-            'output_dir': str(self.output_dir),
+            'output_dir': self._output_dir_str if output_dir_as_str else self.output_dir,
             'hw_accel': hw_accel,
             'audio_device': audio_device
         }
+    
+    def save_config(self):
+        """Guarda la configuración"""
+        config = self._build_config(output_dir_as_str=True)
+        if config == self._last_saved_config:
+            # Nada cambió desde el último guardado: no tocar el disco
+            QMessageBox.information(self, "Success", "Configuration saved successfully!")
+            return
         
-        config_file = Path(__file__).parent.parent.parent / "config.json"
+        self._config_writer.submit(self._write_config_file, _CONFIG_FILE, config)
+    
+    def _write_config_file(self, config_file: Path, config: dict):
+        """
+        Escribe config.json de forma atómica (se ejecuta en el worker)
+        
+        Se escribe en un temporal que luego reemplaza al archivo final, para
+        no dejar un config.json a medias si el proceso muere durante la escritura.
+        """
+        tmp_file = config_file.with_suffix('.json.tmp')
+        error = ""
         try:
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
-            
-            self.config_saved.emit(config)
-            QMessageBox.information(self, "Success", "Configuration saved successfully!")
+            # Codificar de una vez y escribir con una sola llamada (json.dump
+            # escribe el documento a trozos)
+            payload = json.dumps(config, separators=(',', ':')).encode('utf-8')
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, config_file)
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Could not save:\n{str(e)}")
+            error = str(e)
+            # No dejar el temporal a medio escribir junto al config.json bueno
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+        
+        self._config_written.emit(config, error)
+    
+    def _on_config_written(self, config: dict, error: str):
+        """Notifica el resultado del guardado en el hilo de la GUI"""
+        if error:
+            QMessageBox.critical(self, "Error", f"Could not save:\n{error}")
+            return
+        
+        self._last_saved_config = config
+        self.config_saved.emit(config)
+        QMessageBox.information(self, "Success", "Configuration saved successfully!")
     
     def get_config(self) -> dict:
         """Obtiene la configuración actual"""
-        # Mapear codec seleccionado
-        codec_map = {
-            'Auto (Detect GPU)': None,
-            'NVIDIA NVENC (h264_nvenc)': 'nvenc',
-            'Intel QuickSync (h264_qsv)': 'qsv',
-            'Apple VideoToolbox (macOS)': 'videotoolbox',
-            'Software (libx264)': None
-        }
-        
-        selected_codec = self.codec_combo.currentText()
-        hw_accel = codec_map.get(selected_codec)
-        
-        # Dispositivo de audio seleccionado
-        audio_device = None
-        if self.audio_combo.currentText() != 'Auto (System Default)':
-            audio_device = self.audio_combo.currentText()
-        
-        return {
-            'fps': self.fps_combo.currentText(),
-            'crf': self.crf_combo.currentText(),
-            'preset': self.preset_combo.currentText(),
-            'interval': self.interval_combo.currentText(),
-            'output_dir': self.output_dir,
-            'hw_accel': hw_accel,
-            'audio_device': audio_device
-        }
+        self._ensure_built()
+        return self._build_config()
@@ -5,14 +5,257 @@ CORREGIDO según estructuras C++ de ACC con #pragma pack(4)
 """
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                               QFrame, QScrollArea, QComboBox, QGridLayout)
-from PySide6.QtCore import QTimer, Qt
-from PySide6.QtGui import QFont
+                               QFrame, QScrollArea, QComboBox, QTableView, QHeaderView,
+                               QAbstractItemView)
+from PySide6.QtCore import QTimer, Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QFont, QColor
 import struct
 import mmap
-from typing import Dict, Optional, Any
+import time
+from operator import itemgetter
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 
-from gui.styles import COLORS, PANEL_STYLE, PANEL_TITLE_STYLE
+from gui.styles import (COLORS, PANEL_STYLE, PANEL_TITLE_STYLE, CONNECTION_OK_STYLE, CONNECTION_OFF_STYLE,
+                        FIELD_TABLE_STYLE)
+
+
+def _compile_layout(fields: Tuple[Tuple[Optional[str], str], ...]) -> tuple:
+    """
+    Compila la descripción de una estructura de memoria compartida
+    
+    Args:
+        fields: Pares (nombre, formato) en orden de memoria. Formatos: 'i'/'f'
+                escalar, 'Ni'/'Nf' array (se muestra como nombre[0]..nombre[N-1]),
+                'Ns' cadena wchar_t de N bytes y 'Nx' relleno (nombre None)
+    
+    Returns:
+        (struct.Struct, nombres de los valores, índices de los valores de texto)
+    """
+    fmt = ['<']
+    names = []
+    text_indexes = []
+    for name, code in fields:
+        fmt.append(code)
+        kind, count = code[-1], int(code[:-1] or 1)
+        if kind == 'x':
+            continue
+        if kind == 's':
+            text_indexes.append(len(names))
+            names.append(name)
+        elif code[:-1]:
+            names.extend(f'{name}[{i}]' for i in range(count))
+        else:
+            names.append(name)
+    return struct.Struct(''.join(fmt)), tuple(names), tuple(text_indexes)
+
+
+def _decode_utf16le(raw: bytes) -> str:
+    """Decodifica una cadena wchar_t terminada en NUL, sin procesar lo que hay tras el terminador"""
+    end = raw.find(b'\x00\x00')
+    while end != -1 and end % 2:
+        # Coincidencia a caballo entre dos caracteres: seguir buscando en posición par
+        end = raw.find(b'\x00\x00', end + 1)
+    if end != -1:
+        raw = raw[:end]
+    return raw.decode('utf-16-le', errors='ignore')
+
+
+# SPageFilePhysics.packetId: avanza con cada paso de la física
+_PACKET_ID = struct.Struct('<i')
+
+# Resultado de parsear un bloque: (nombres, valores) en orden de memoria
+ParsedBlock = Tuple[Tuple[str, ...], Sequence[Any]]
+# Nombres del bloque cuando falla la lectura
+_ERROR_NAMES = ('error',)
+
+
+# Formateadores de valores: el tipo de cada campo es fijo, se eligen al crear las filas
+_FORMAT_FLOAT = '{:.3f}'.format
+_FORMAT_INT = str
+
+
+def _format_text(value: Any) -> str:
+    """Formatea un valor de texto (u otro tipo) limitando su longitud"""
+    return str(value)[:50]  # Limitar strings largos
+
+
+def _formatter_for(value: Any):
+    """Devuelve el formateador adecuado al tipo del valor"""
+    if isinstance(value, float):
+        return _FORMAT_FLOAT
+    if isinstance(value, int):
+        return _FORMAT_INT
+    return _format_text
+
+
+# SPageFilePhysics (campos mostrados y huecos que se saltan)
+_PHYSICS_LAYOUT = _compile_layout((
+    ('packetId', 'i'), ('gas', 'f'), ('brake', 'f'), ('fuel', 'f'),
+    ('gear', 'i'), ('rpms', 'i'), ('steerAngle', 'f'), ('speedKmh', 'f'),
+    ('velocity', '3f'), ('accG', '3f'),
+    ('wheelSlip', '4f'), ('wheelLoad', '4f'), ('wheelPress', '4f'), ('wheelAngSpeed', '4f'),
+    ('tyreWear', '4f'), ('tyreDirty', '4f'), ('tyreCoreTemp', '4f'), ('camberRAD', '4f'),
+    ('suspTravel', '4f'),
+    ('drs', 'f'), ('tc', 'f'), ('heading', 'f'), ('pitch', 'f'), ('roll', 'f'), ('cgHeight', 'f'),
+    ('damage', '5f'),
+    ('tyresOut', 'i'), ('pitLimiter', 'i'), ('abs', 'f'),
+    (None, '8x'),  # kersCharge, kersInput (no usados en ACC)
+    ('autoShifter', 'i'), ('rideHeight', '2f'),
+    ('turboBoost', 'f'), ('ballast', 'f'), ('airDensity', 'f'), ('airTemp', 'f'), ('roadTemp', 'f'),
+    ('localAngVel', '3f'), ('finalFF', 'f'), ('perfMeter', 'f'),
+    (None, '28x'),  # engineBrake, campos ERS (no usados en ACC) - 6 ints + 1 float
+    ('brakeTemp', '4f'), ('clutch', 'f'),
+    (None, '48x'),  # tyreTempI[4], tyreTempM[4], tyreTempO[4]
+    ('isAI', 'i'),
+    (None, '144x'),  # tyreContactPoint/Normal/Heading[4][3]
+    ('brakeBias', 'f'), ('localVel', '3f'),
+    (None, '8x'),  # P2P - 2 ints
+    ('currentMaxRpm', 'i'),
+    (None, '48x'),  # mz[4], fx[4], fy[4]
+    ('slipRatio', '4f'), ('slipAngle', '4f'),
+    ('tcinAction', 'i'), ('absInAction', 'i'),
+    ('suspDamage', '4f'), ('tyreTemp', '4f'),
+))
+
+# SPageFileGraphic
+_GRAPHICS_LAYOUT = _compile_layout((
+    ('packetId', 'i'), ('status', 'i'), ('session', 'i'),
+    ('currentTime', '30s'), ('lastTime', '30s'), ('bestTime', '30s'), ('split', '30s'),  # wchar_t[15]
+    ('completedLaps', 'i'), ('position', 'i'),
+    ('iCurrentTime', 'i'), ('iLastTime', 'i'), ('iBestTime', 'i'),
+    ('sessionTimeLeft', 'f'), ('distanceTraveled', 'f'),
+    ('isInPit', 'i'), ('currentSector', 'i'), ('lastSectorTime', 'i'), ('numberOfLaps', 'i'),
+    ('tyreCompound', '66s'),  # wchar_t[33]
+    ('replayMult', 'f'), ('normalizedPos', 'f'), ('activeCars', 'i'),
+    ('carCoord[0]', '3f'),
+    (None, '708x'),  # resto de carCoordinates[60][3]
+    ('carID[0]', 'i'),
+    (None, '236x'),  # resto de carID[60]
+    ('playerCarID', 'i'), ('penaltyTime', 'f'), ('flag', 'i'), ('penalty', 'i'),
+    ('idealLineOn', 'i'), ('isInPitLane', 'i'), ('surfaceGrip', 'f'), ('mandPitDone', 'i'),
+    ('windSpeed', 'f'), ('windDirection', 'f'),
+    ('setupMenuVis', 'i'), ('mainDisplay', 'i'), ('secDisplay', 'i'),
+    ('TC', 'i'), ('TCCut', 'i'), ('EngineMap', 'i'), ('ABS', 'i'), ('fuelXLap', 'i'),
+    ('rainLights', 'i'), ('flashLights', 'i'), ('lightsStage', 'i'), ('exhaustTemp', 'f'),
+    ('wiperLV', 'i'), ('stintTotal', 'i'), ('stintTime', 'i'), ('rainTyres', 'i'),
+))
+
+# SPageFileStatic
+_STATIC_LAYOUT = _compile_layout((
+    ('smVersion', '30s'), ('acVersion', '30s'),  # wchar_t[15]
+    ('numSessions', 'i'), ('numCars', 'i'),
+    ('carModel', '66s'), ('track', '66s'),  # wchar_t[33]
+    ('playerName', '66s'), ('playerSurname', '66s'), ('playerNick', '66s'),
+    ('sectorCount', 'i'), ('maxTorque', 'f'), ('maxPower', 'f'), ('maxRpm', 'i'), ('maxFuel', 'f'),
+    ('suspMaxTravel', '4f'), ('tyreRadius', '4f'), ('maxTurbo', 'f'),
+    (None, '8x'),  # deprecated_1, deprecated_2
+    ('penaltiesOn', 'i'), ('aidFuelRate', 'f'), ('aidTyreRate', 'f'), ('aidMechDmg', 'f'),
+    ('tyreBlankets', 'i'), ('aidStability', 'f'), ('aidAutoClutch', 'i'), ('aidAutoBlip', 'i'),
+    (None, '32x'),  # hasDRS, hasERS, hasKERS, kersMaxJ, engineBrakeSettingsCount, ersPowerControllerCount, trackSPlineLength, ersMaxJ
+    ('trackConfig', '66s'),
+    (None, '4x'),
+    ('isTimedRace', 'i'), ('hasExtraLap', 'i'),
+    ('carSkin', '66s'),
+    ('reversedGrid', 'i'), ('pitWinStart', 'i'), ('pitWinEnd', 'i'), ('isOnline', 'i'),
+))
+
+
+class FieldsModel(QAbstractTableModel):
+    """
+    Modelo campo/valor de un bloque de memoria compartida
+    
+    Guarda el texto ya formateado de cada valor y solo notifica a la vista
+    las filas cuyo texto ha cambiado.
+    """
+    
+    # Alto de cada fila (px); la tabla crece para mostrarlas todas
+    ROW_HEIGHT = 22
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._keys: List[str] = []
+        self._texts: List[str] = []
+        # Nombres en orden de memoria con los que se construyeron las filas
+        self._names: Tuple[str, ...] = ()
+        # Extrae de una vez los valores en el orden de las filas
+        self._row_values = self._make_row_getter([])
+        self._formatters: List[Any] = []
+        self._name_color = QColor(COLORS['text_light'])
+        self._value_font = QFont()
+        self._value_font.setBold(True)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._keys)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row, column = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            return f"{self._keys[row]}:" if column == 0 else self._texts[row]
+        if role == Qt.ForegroundRole and column == 0:
+            return self._name_color
+        if role == Qt.FontRole and column == 1:
+            return self._value_font
+        return None
+    
+    def update_fields(self, names: Tuple[str, ...], values: Sequence[Any]):
+        """
+        Aplica nuevos valores; los campos se muestran en orden alfabético
+        
+        Args:
+            names: Nombres de los valores (tupla constante del layout)
+            values: Valores en el mismo orden que names
+        """
+        # Los nombres son constantes de módulo: basta comparar identidad
+        if names is not self._names:
+            # Cambió el conjunto de campos: reconstruir la tabla
+            self.beginResetModel()
+            order = sorted(range(len(names)), key=names.__getitem__)
+            self._names = names
+            self._keys = [names[i] for i in order]
+            self._texts = [''] * len(self._keys)
+            self._row_values = self._make_row_getter(order)
+            self._formatters = [_formatter_for(value) for value in self._row_values(values)]
+            self._apply(values)
+            self.endResetModel()
+            return
+        
+        first, last = self._apply(values)
+        if first >= 0:
+            self.dataChanged.emit(self.index(first, 1), self.index(last, 1), [Qt.DisplayRole])
+    
+    @staticmethod
+    def _make_row_getter(order: List[int]):
+        """Devuelve una función que reordena los valores al orden de las filas"""
+        if len(order) == 1:
+            index = order[0]
+            return lambda values: (values[index],)
+        if not order:
+            return lambda values: ()
+        return itemgetter(*order)
+    
+    def _apply(self, values: Sequence[Any]) -> Tuple[int, int]:
+        """
+        Formatea los valores y guarda los que cambian
+        
+        Returns:
+            Primera y última fila modificadas, o (-1, -1) si no cambió ninguna
+        """
+        texts = self._texts
+        first = last = -1
+        for row, (formatter, value) in enumerate(zip(self._formatters, self._row_values(values))):
+            text = formatter(value)
+            if texts[row] != text:
+                texts[row] = text
+                if first < 0:
+                    first = row
+                last = row
+        return first, last
 
 
 class SharedMemoryTab(QWidget):
@@ -33,25 +276,58 @@ class SharedMemoryTab(QWidget):
         }
     }
     
+    # Intervalo de refresco de los paneles (10 Hz: suficiente para leer los valores)
+    UPDATE_INTERVAL_MS = 100
+    # Con la física parada (pausa, menús) se refresca más despacio tras IDLE_TICKS lecturas
+    IDLE_INTERVAL_MS = 400
+    IDLE_TICKS = 10
+    # Espera entre reintentos de conexión: se duplica en cada fallo hasta el máximo
+    RECONNECT_BACKOFF_MIN_MS = 50
+    RECONNECT_BACKOFF_MAX_MS = 2000
+    
     def __init__(self):
         super().__init__()
         
         self.physics_handle = None
         self.graphics_handle = None
         self.static_handle = None
+        # Vistas sobre los mmap (se crean al conectar y se liberan antes de cerrarlos)
+        self.physics_mv: Optional[memoryview] = None
+        self.graphics_mv: Optional[memoryview] = None
+        self.static_mv: Optional[memoryview] = None
         self.connected = False
         self.current_simulator = 'ACC'
+        # Sin el juego abierto no se reintenta en cada tick (cada intento crea tres mmap)
+        self._backoff_ms = self.RECONNECT_BACKOFF_MIN_MS
+        self._next_retry = 0.0
+        self._last_packet_id: Optional[int] = None
+        self._idle_ticks = 0
+        
+        self.physics_model = FieldsModel(self)
+        self.graphics_model = FieldsModel(self)
+        self.static_model = FieldsModel(self)
         
-        self.physics_labels = {}
-        self.graphics_labels = {}
-        self.static_labels = {}
+        # Últimos bytes mostrados de cada bloque: si no cambian no se reparsea ni repinta
+        self._last_blocks: Dict[str, bytearray] = {}
         
         self.setup_ui()
         
-        # Timer para actualización
-        self.timer = QTimer()
+        # Timer para actualización: solo corre mientras la pestaña está visible
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.UPDATE_INTERVAL_MS)
         self.timer.timeout.connect(self.update_data)
-        self.timer.start(50)  # 20Hz
+    
+    def showEvent(self, event):
+        """Reanuda la lectura de la memoria compartida al mostrar la pestaña"""
+        super().showEvent(event)
+        if not self.timer.isActive():
+            self.timer.start()
+            self.update_data()
+    
+    def hideEvent(self, event):
+        """Detiene la lectura mientras la pestaña está oculta"""
+        super().hideEvent(event)
+        self.timer.stop()
         
     def setup_ui(self):
         """Configura la interfaz"""
@@ -92,9 +368,9 @@ class SharedMemoryTab(QWidget):
         content_layout.setSpacing(16)
         
         # Crear paneles para cada tipo de memoria
-        self.physics_panel = self.create_memory_panel("Physics Memory", self.physics_labels)
-        self.graphics_panel = self.create_memory_panel("Graphics Memory", self.graphics_labels)
-        self.static_panel = self.create_memory_panel("Static Memory", self.static_labels)
+        self.physics_panel = self.create_memory_panel("Physics Memory", self.physics_model)
+        self.graphics_panel = self.create_memory_panel("Graphics Memory", self.graphics_model)
+        self.static_panel = self.create_memory_panel("Static Memory", self.static_model)
         
         content_layout.addWidget(self.physics_panel)
         content_layout.addWidget(self.graphics_panel)
@@ -147,7 +423,7 @@ class SharedMemoryTab(QWidget):
         self.simulator_combo.currentTextChanged.connect(self.on_simulator_changed)
         
         self.connection_status = QLabel("● Disconnected")
-        self.connection_status.setStyleSheet(f"color: {COLORS['status_offline']}; font-size: 13px; font-weight: 600;")
+        self.connection_status.setStyleSheet(CONNECTION_OFF_STYLE)
         
         layout.addWidget(label)
         layout.addWidget(self.simulator_combo)
@@ -157,7 +433,7 @@ class SharedMemoryTab(QWidget):
         header.setLayout(layout)
         return header
     
-    def create_memory_panel(self, title: str, labels_dict: dict) -> QFrame:
+    def create_memory_panel(self, title: str, model: FieldsModel) -> QFrame:
         """Crea un panel para un tipo de memoria"""
         panel = QFrame()
         panel.setStyleSheet(PANEL_STYLE)
@@ -171,22 +447,40 @@ class SharedMemoryTab(QWidget):
         title_label.setStyleSheet(PANEL_TITLE_STYLE)
         layout.addWidget(title_label)
         
-        # Grid para los datos
-        grid = QGridLayout()
-        grid.setSpacing(8)
-        grid.setContentsMargins(0, 8, 0, 0)
-        
-        labels_dict['grid'] = grid
-        
-        layout.addLayout(grid)
+        # Tabla campo/valor sin cabeceras ni scroll propio (el scroll es el de la pestaña)
+        table = QTableView()
+        table.setModel(model)
+        table.setStyleSheet(FIELD_TABLE_STYLE)
+        table.setShowGrid(False)
+        table.setFocusPolicy(Qt.NoFocus)
+        table.setSelectionMode(QAbstractItemView.NoSelection)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        table.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        table.horizontalHeader().hide()
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        table.horizontalHeader().setStretchLastSection(True)
+        table.verticalHeader().hide()
+        table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        table.verticalHeader().setDefaultSectionSize(FieldsModel.ROW_HEIGHT)
+        table.setFixedHeight(0)
+        model.modelReset.connect(lambda: self._fit_table_height(table))
+        
+        layout.addWidget(table)
         panel.setLayout(layout)
         
         return panel
     
+    @staticmethod
+    def _fit_table_height(table: QTableView):
+        """Ajusta la altura de la tabla para mostrar todas sus filas"""
+        table.setFixedHeight(table.verticalHeader().length() + 2 * table.frameWidth())
+    
     def on_simulator_changed(self, simulator: str):
         """Cambia el simulador"""
         self.disconnect_simulator()
         self.current_simulator = simulator
+        self._backoff_ms = self.RECONNECT_BACKOFF_MIN_MS
         self.connect_simulator()
     
     def connect_simulator(self) -> bool:
@@ -199,19 +493,34 @@ class SharedMemoryTab(QWidget):
             self.graphics_handle = mmap.mmap(-1, size, config['graphics'])
             self.static_handle = mmap.mmap(-1, size, config['static'])
             
+            self.physics_mv = memoryview(self.physics_handle)
+            self.graphics_mv = memoryview(self.graphics_handle)
+            self.static_mv = memoryview(self.static_handle)
+            
+            self._last_blocks.clear()
+            self._backoff_ms = self.RECONNECT_BACKOFF_MIN_MS
+            self._last_packet_id = None
             self.connected = True
             self.connection_status.setText(f"● Connected to {self.current_simulator}")
-            self.connection_status.setStyleSheet(f"color: {COLORS['status_recording']}; font-size: 13px; font-weight: 600;")
+            self.connection_status.setStyleSheet(CONNECTION_OK_STYLE)
             return True
             
         except Exception as e:
             self.connected = False
+            self._next_retry = time.monotonic() + self._backoff_ms / 1000
+            self._backoff_ms = min(self._backoff_ms * 2, self.RECONNECT_BACKOFF_MAX_MS)
             self.connection_status.setText("● Disconnected")
-            self.connection_status.setStyleSheet(f"color: {COLORS['status_offline']}; font-size: 13px; font-weight: 600;")
+            self.connection_status.setStyleSheet(CONNECTION_OFF_STYLE)
             return False
     
     def disconnect_simulator(self):
         """Desconecta de la memoria compartida"""
+        # Un mmap con vistas exportadas no se puede cerrar
+        for mv in (self.physics_mv, self.graphics_mv, self.static_mv):
+            if mv is not None:
+                mv.release()
+        self.physics_mv = self.graphics_mv = self.static_mv = None
+        
         if self.physics_handle:
             self.physics_handle.close()
         if self.graphics_handle:
@@ -221,416 +530,115 @@ class SharedMemoryTab(QWidget):
         
         self.connected = False
         self.connection_status.setText("● Disconnected")
-        self.connection_status.setStyleSheet(f"color: {COLORS['status_offline']}; font-size: 13px; font-weight: 600;")
+        self.connection_status.setStyleSheet(CONNECTION_OFF_STYLE)
     
     def update_data(self):
         """Actualiza los datos de la memoria compartida"""
         if not self.connected:
-            self.connect_simulator()
+            if time.monotonic() >= self._next_retry:
+                self.connect_simulator()
             return
         
         try:
-            # Leer y parsear cada tipo de memoria
-            physics_data = self.read_and_parse_physics()
-            graphics_data = self.read_and_parse_graphics()
-            static_data = self.read_and_parse_static()
-            
-            # Actualizar UI
-            self.update_panel(self.physics_labels, physics_data)
-            self.update_panel(self.graphics_labels, graphics_data)
-            self.update_panel(self.static_labels, static_data)
+            self._track_activity(_PACKET_ID.unpack_from(self.physics_mv, 0)[0])
+            
+            # Leer, parsear y mostrar solo los bloques visibles cuyos bytes han
+            # cambiado (con el juego en pausa o en menús no se toca ninguna tabla).
+            # Un panel fuera de la zona visible se pone al día al volver a ella
+            if (self._panel_in_view(self.physics_panel)
+                    and self._block_changed('physics', self.physics_mv, _PHYSICS_LAYOUT)):
+                self.update_panel(self.physics_model, self.read_and_parse_physics())
+            if (self._panel_in_view(self.graphics_panel)
+                    and self._block_changed('graphics', self.graphics_mv, _GRAPHICS_LAYOUT)):
+                self.update_panel(self.graphics_model, self.read_and_parse_graphics())
+            if (self._panel_in_view(self.static_panel)
+                    and self._block_changed('static', self.static_mv, _STATIC_LAYOUT)):
+                self.update_panel(self.static_model, self.read_and_parse_static())
             
         except Exception as e:
             self.connected = False
             self.connection_status.setText(f"● Error: {str(e)[:30]}")
-            self.connection_status.setStyleSheet(f"color: {COLORS['status_offline']}; font-size: 13px; font-weight: 600;")
+            self.connection_status.setStyleSheet(CONNECTION_OFF_STYLE)
     
-    def read_and_parse_physics(self) -> Dict[str, Any]:
-        """Lee y parsea SPageFilePhysics según estructura C++ con pack(4)"""
-        if not self.physics_handle:
-            return {}
+    def _track_activity(self, packet_id: int):
+        """Ajusta el intervalo del timer según avance o no la física del simulador"""
+        if packet_id != self._last_packet_id:
+            self._last_packet_id = packet_id
+            if self._idle_ticks >= self.IDLE_TICKS:
+                self.timer.setInterval(self.UPDATE_INTERVAL_MS)
+            self._idle_ticks = 0
+            return
         
-        try:
-            self.physics_handle.seek(0)
-            data = self.physics_handle.read(4096)
-            
-            parsed = {}
-            offset = 0
-            
-            # Estructura C++ exacta con pack(4)
-            parsed['packetId'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['gas'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['brake'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['fuel'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['gear'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['rpms'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['steerAngle'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['speedKmh'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # velocity[3]
-            parsed['velocity[0]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['velocity[1]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['velocity[2]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # accG[3]
-            parsed['accG[0]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['accG[1]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['accG[2]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # wheelSlip[4]
-            parsed['wheelSlip[0]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['wheelSlip[1]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['wheelSlip[2]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['wheelSlip[3]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # wheelLoad[4]
-            parsed['wheelLoad[0]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['wheelLoad[1]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['wheelLoad[2]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['wheelLoad[3]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # wheelsPressure[4]
-            parsed['wheelPress[0]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['wheelPress[1]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['wheelPress[2]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['wheelPress[3]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # wheelAngularSpeed[4]
-            parsed['wheelAngSpeed[0]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['wheelAngSpeed[1]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['wheelAngSpeed[2]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['wheelAngSpeed[3]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # tyreWear[4]
-            parsed['tyreWear[0]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['tyreWear[1]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['tyreWear[2]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['tyreWear[3]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # tyreDirtyLevel[4]
-            parsed['tyreDirty[0]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['tyreDirty[1]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['tyreDirty[2]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['tyreDirty[3]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # tyreCoreTemperature[4]
-            parsed['tyreCoreTemp[0]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['tyreCoreTemp[1]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['tyreCoreTemp[2]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['tyreCoreTemp[3]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # camberRAD[4]
-            parsed['camberRAD[0]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['camberRAD[1]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['camberRAD[2]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['camberRAD[3]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # suspensionTravel[4]
-            parsed['suspTravel[0]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['suspTravel[1]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['suspTravel[2]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['suspTravel[3]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            parsed['drs'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['tc'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['heading'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['pitch'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['roll'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['cgHeight'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # carDamage[5]
-            parsed['damage[0]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['damage[1]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['damage[2]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['damage[3]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['damage[4]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            parsed['tyresOut'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['pitLimiter'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['abs'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # kersCharge, kersInput (not used in ACC)
-            offset += 8
-            
-            parsed['autoShifter'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            
-            # rideHeight[2]
-            parsed['rideHeight[0]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['rideHeight[1]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            parsed['turboBoost'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['ballast'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['airDensity'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['airTemp'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['roadTemp'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # localAngularVel[3]
-            parsed['localAngVel[0]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['localAngVel[1]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['localAngVel[2]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            parsed['finalFF'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['perfMeter'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # engineBrake, ers fields (not used in ACC) - 6 ints + 1 float = 28 bytes
-            offset += 28
-            
-            # brakeTemp[4]
-            parsed['brakeTemp[0]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['brakeTemp[1]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['brakeTemp[2]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['brakeTemp[3]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            parsed['clutch'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # tyreTempI[4], tyreTempM[4], tyreTempO[4] - 12 floats
-            offset += 48
-            
-            parsed['isAI'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            
-            # tyreContactPoint[4][3], tyreContactNormal[4][3], tyreContactHeading[4][3] - 36 floats
-            offset += 144
-            
-            parsed['brakeBias'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # localVelocity[3]
-            parsed['localVel[0]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['localVel[1]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['localVel[2]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # P2P - 2 ints
-            offset += 8
-            
-            parsed['currentMaxRpm'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            
-            # mz[4], fx[4], fy[4] - 12 floats
-            offset += 48
-            
-            # slipRatio[4]
-            parsed['slipRatio[0]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['slipRatio[1]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['slipRatio[2]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['slipRatio[3]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # slipAngle[4]
-            parsed['slipAngle[0]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['slipAngle[1]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['slipAngle[2]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['slipAngle[3]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            parsed['tcinAction'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['absInAction'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            
-            # suspensionDamage[4]
-            parsed['suspDamage[0]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['suspDamage[1]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['suspDamage[2]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['suspDamage[3]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # tyreTemp[4]
-            parsed['tyreTemp[0]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['tyreTemp[1]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['tyreTemp[2]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['tyreTemp[3]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            return parsed
-            
-        except Exception as e:
-            return {'error': str(e)}
+        self._idle_ticks += 1
+        if self._idle_ticks == self.IDLE_TICKS:
+            self.timer.setInterval(self.IDLE_INTERVAL_MS)
     
-    def read_and_parse_graphics(self) -> Dict[str, Any]:
-        """Lee y parsea SPageFileGraphic según estructura C++ con pack(4)"""
-        if not self.graphics_handle:
-            return {}
+    @staticmethod
+    def _panel_in_view(panel: QFrame) -> bool:
+        """Indica si alguna parte del panel queda dentro de la zona visible del scroll"""
+        return not panel.visibleRegion().isEmpty()
+    
+    def _block_changed(self, key: str, view: Optional[memoryview], layout: tuple) -> bool:
+        """
+        Indica si los bytes de un bloque difieren de los últimos mostrados
+        
+        La comparación se hace sobre la vista del mmap; solo se copia el
+        bloque cuando ha cambiado, sobre un bytearray que se reutiliza.
+        """
+        if view is None:
+            return False
         
-        try:
-            self.graphics_handle.seek(0)
-            data = self.graphics_handle.read(4096)
-            
-            parsed = {}
-            offset = 0
-            
-            parsed['packetId'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['status'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['session'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            
-            # wchar_t[15] = 30 bytes
-            parsed['currentTime'] = data[offset:offset+30].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 30
-            parsed['lastTime'] = data[offset:offset+30].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 30
-            parsed['bestTime'] = data[offset:offset+30].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 30
-            parsed['split'] = data[offset:offset+30].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 30
-            
-            parsed['completedLaps'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['position'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['iCurrentTime'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['iLastTime'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['iBestTime'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['sessionTimeLeft'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['distanceTraveled'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['isInPit'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['currentSector'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['lastSectorTime'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['numberOfLaps'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            
-            # wchar_t[33] = 66 bytes
-            parsed['tyreCompound'] = data[offset:offset+66].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 66
-            
-            parsed['replayMult'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['normalizedPos'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['activeCars'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            
-            # carCoordinates[60][3] - 180 floats - solo mostramos primeros
-            for i in range(3):
-                parsed[f'carCoord[0][{i}]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            offset += 708  # Saltamos el resto (57 * 3 floats)
-            
-            # carID[60] - 60 ints - solo mostramos primero
-            parsed['carID[0]'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            offset += 236  # Saltamos el resto (59 ints)
-            
-            parsed['playerCarID'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['penaltyTime'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['flag'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['penalty'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['idealLineOn'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['isInPitLane'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['surfaceGrip'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['mandPitDone'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['windSpeed'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['windDirection'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['setupMenuVis'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['mainDisplay'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['secDisplay'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['TC'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['TCCut'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['EngineMap'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['ABS'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['fuelXLap'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['rainLights'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['flashLights'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['lightsStage'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['exhaustTemp'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['wiperLV'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['stintTotal'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['stintTime'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['rainTyres'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            
-            return parsed
-            
-        except Exception as e:
-            return {'error': str(e)}
+        current = view[:layout[0].size]
+        last = self._last_blocks.get(key)
+        if last is None:
+            self._last_blocks[key] = bytearray(current)
+            return True
+        if current == last:
+            return False
+        
+        last[:] = current  # Mismo tamaño: copia sin reservar memoria
+        return True
+    
+    def read_and_parse_physics(self) -> ParsedBlock:
+        """Lee y parsea SPageFilePhysics según estructura C++ con pack(4)"""
+        return self._read_and_parse(self.physics_mv, _PHYSICS_LAYOUT)
     
-    def read_and_parse_static(self) -> Dict[str, Any]:
+    def read_and_parse_graphics(self) -> ParsedBlock:
+        """Lee y parsea SPageFileGraphic según estructura C++ con pack(4)"""
+        return self._read_and_parse(self.graphics_mv, _GRAPHICS_LAYOUT)
+    
+    def read_and_parse_static(self) -> ParsedBlock:
         """Lee y parsea SPageFileStatic según estructura C++ con pack(4)"""
-        if not self.static_handle:
-            return {}
-        
+        return self._read_and_parse(self.static_mv, _STATIC_LAYOUT)
+    
+    @staticmethod
+    def _read_and_parse(view: Optional[memoryview], layout: tuple) -> ParsedBlock:
+        """
+        Lee un bloque de memoria compartida y lo parsea con un único unpack
+        
+        Args:
+            view: memoryview sobre el mmap del bloque
+            layout: (struct.Struct, nombres, índices de texto) de _compile_layout
+        
+        Returns:
+            (nombres, valores) en orden de memoria
+        """
+        if view is None:
+            return (), ()
+        
+        layout_struct, names, text_indexes = layout
         try:
-            self.static_handle.seek(0)
-            data = self.static_handle.read(4096)
-            
-            parsed = {}
-            offset = 0
-            
-            # wchar_t[15] = 30 bytes
-            parsed['smVersion'] = data[offset:offset+30].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 30
-            parsed['acVersion'] = data[offset:offset+30].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 30
-            
-            parsed['numSessions'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['numCars'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            
-            # wchar_t[33] = 66 bytes
-            parsed['carModel'] = data[offset:offset+66].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 66
-            parsed['track'] = data[offset:offset+66].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 66
-            parsed['playerName'] = data[offset:offset+66].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 66
-            parsed['playerSurname'] = data[offset:offset+66].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 66
-            parsed['playerNick'] = data[offset:offset+66].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 66
-            
-            parsed['sectorCount'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['maxTorque'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['maxPower'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['maxRpm'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['maxFuel'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # suspensionMaxTravel[4]
-            for i in range(4):
-                parsed[f'suspMaxTravel[{i}]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # tyreRadius[4]
-            for i in range(4):
-                parsed[f'tyreRadius[{i}]'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            parsed['maxTurbo'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            
-            # deprecated_1, deprecated_2
-            offset += 8
-            
-            parsed['penaltiesOn'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['aidFuelRate'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['aidTyreRate'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['aidMechDmg'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['tyreBlankets'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['aidStability'] = struct.unpack('f', data[offset:offset+4])[0]; offset += 4
-            parsed['aidAutoClutch'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['aidAutoBlip'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            
-            # DRS/ERS/KERS fields
-            offset += 32  # hasDRS, hasERS, hasKERS, kersMaxJ, engineBrakeSettingsCount, ersPowerControllerCount, trackSPlineLength, ersMaxJ
-            
-            # wchar_t[33] = 66 bytes
-            parsed['trackConfig'] = data[offset:offset+66].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 66
-            
-            offset += 4  # ersMaxJ ya contado arriba, saltar otros campos
-            
-            parsed['isTimedRace'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['hasExtraLap'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            
-            # wchar_t[33] = 66 bytes
-            parsed['carSkin'] = data[offset:offset+66].decode('utf-16-le', errors='ignore').rstrip('\x00'); offset += 66
-            
-            parsed['reversedGrid'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['pitWinStart'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['pitWinEnd'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            parsed['isOnline'] = struct.unpack('i', data[offset:offset+4])[0]; offset += 4
-            
-            return parsed
+            # unpack_from lee del mmap en sitio, sin copiar el bloque a un bytes
+            values = layout_struct.unpack_from(view, 0)
+            if text_indexes:
+                values = list(values)
+                for i in text_indexes:
+                    values[i] = _decode_utf16le(values[i])
+            return names, values
             
         except Exception as e:
-            return {'error': str(e)}
+            return _ERROR_NAMES, (str(e),)
     
-    def update_panel(self, labels_dict: dict, data: Dict[str, Any]):
+    def update_panel(self, model: FieldsModel, data: ParsedBlock):
         """Actualiza un panel con nuevos datos"""
-        if 'grid' not in labels_dict:
-            return
-        
-        grid = labels_dict['grid']
-        
-        # Ordenar las claves para mantener orden consistente
-        sorted_keys = sorted(data.keys())
-        
-        row = 0
-        for key in sorted_keys:
-            value = data[key]
-            
-            # Si no existe el label, crearlo
-            if key not in labels_dict:
-                name_label = QLabel(f"{key}:")
-                name_label.setStyleSheet(f"color: {COLORS['text_light']}; font-size: 12px; font-family: 'Consolas', 'Monaco', monospace;")
-                
-                value_label = QLabel()
-                value_label.setStyleSheet(f"color: {COLORS['text_primary']}; font-size: 12px; font-weight: 600; font-family: 'Consolas', 'Monaco', monospace;")
-                
-                grid.addWidget(name_label, row, 0)
-                grid.addWidget(value_label, row, 1)
-                
-                labels_dict[key] = value_label
-            
-            # Actualizar valor
-            if isinstance(value, float):
-                labels_dict[key].setText(f"{value:.3f}")
-            elif isinstance(value, int):
-                labels_dict[key].setText(str(value))
-            else:
-                labels_dict[key].setText(str(value)[:50])  # Limitar strings largos
-            
-            row += 1
+        model.update_fields(*data)
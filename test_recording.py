@@ -45,8 +45,8 @@ def main():
     def on_update(data):
         # Mostrar info cada 10 registros
         if len(recorder.telemetry_data) % 10 == 0:
-            player = data.get('player_telemetry', {})
-            standings = data.get('standings', [])
+            player = data.player_telemetry or {}
+            standings = data.standings
             
             print(f"\r📊 Registros: {len(recorder.telemetry_data)} | "
                   f"Velocidad: {player.get('speed_kmh', 0):.0f} km/h | "
@@ -97,7 +97,7 @@ def main():
                 print(f"   • telemetry.csv - Telemetría en formato CSV")
                 
                 # Exportar clasificación si está disponible
-                if recorder.telemetry_data and recorder.telemetry_data[0].get('standings'):
+                if recorder.telemetry_data and recorder.telemetry_data[0].standings:
                     standings_csv = session_dir / "standings.csv"
                     recorder.export_standings_csv(standings_csv)
                     print(f"   • standings.csv - Clasificación de pilotos")